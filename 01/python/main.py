@@ -1,15 +1,41 @@
 #!/usr/bin/python3
+import sys
+from pathlib import Path
 import re
+from typing import Iterable, Iterator
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.chunks import MappedInput, map_chunks
+from aoc.days import Engine
+from aoc.streams import print_answers, read_byte_lines, read_lines
+
+
+def part_one(path):
+    print(compute_part_one(read_input(path)))
+
+
+def part_two(path):
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> list[str]:
+    return list(stream_input(path))
+
+
+def stream_input(path) -> Iterator[str]:
+    return read_lines(path)
 
 
-def part1():
+def compute_part_one(lines: Iterable[str]) -> int:
     sum_calibration_values = 0
-    with open("../input.txt", "r") as f:
-        for line in f:
-            digits = [char for char in line if str.isdigit(char)]
-            calibration_value = int(digits[0] + digits[-1])
-            sum_calibration_values += calibration_value
-    print(sum_calibration_values)
+    for line in lines:
+        digits = [char for char in line if str.isdigit(char)]
+        calibration_value = int(digits[0] + digits[-1])
+        sum_calibration_values += calibration_value
+    return sum_calibration_values
 
 
 digits_map = {
@@ -25,25 +51,155 @@ digits_map = {
 }
 
 
-def part2():
+def compute_part_two(lines: Iterable[str]) -> int:
     digits_pattern = re.compile(
         r"(?=(one|two|three|four|five|six|seven|eight|nine|[1-9]))"
     )
     sum_calibration_values = 0
-    with open("../input.txt", "r") as f:
-        for line in f:
-            spelled_digits = digits_pattern.findall(line)
-            first_spelled_digit, last_spelled_digit = (
-                spelled_digits[0],
-                spelled_digits[-1],
-            )
-            first_digit = digits_map.get(first_spelled_digit, first_spelled_digit)
-            last_digit = digits_map.get(last_spelled_digit, last_spelled_digit)
-            calibration_value = int(first_digit + last_digit)
-            sum_calibration_values += calibration_value
-    print(sum_calibration_values)
+    for line in lines:
+        spelled_digits = digits_pattern.findall(line)
+        first_spelled_digit, last_spelled_digit = (
+            spelled_digits[0],
+            spelled_digits[-1],
+        )
+        first_digit = digits_map.get(first_spelled_digit, first_spelled_digit)
+        last_digit = digits_map.get(last_spelled_digit, last_spelled_digit)
+        calibration_value = int(first_digit + last_digit)
+        sum_calibration_values += calibration_value
+    return sum_calibration_values
+
+
+class DigitAutomaton:
+    """
+    Finds the first and the last digit of a line, written as a digit or as one of
+    ``words``, in a single scan from either end that stops at the first match.
+
+    Both directions are Aho-Corasick automata over bytes, the backward one built
+    from the reversed words, flattened into DFA tables indexed by
+    ``state * 256 + byte``. A transition completing a match holds ``~digit``,
+    which is negative, so a scan is one lookup and one sign test per byte.
+    Since no word occurs inside another, the match completed first going forward
+    is also the one starting first, as with an overlapping regex.
+    """
+
+    def __init__(self, words: dict[str, int], digits: bytes = b"0123456789"):
+        patterns = {word.encode(): value for word, value in words.items()}
+        patterns.update({bytes([digit]): int(chr(digit)) for digit in digits})
+        self.forward = self._table(patterns)
+        self.backward = self._table(
+            {pattern[::-1]: value for pattern, value in patterns.items()}
+        )
+
+    @staticmethod
+    def _table(patterns: dict[bytes, int]) -> list[int]:
+        goto: list[dict[int, int]] = [{}]
+        values: list[int | None] = [None]
+        for pattern, value in patterns.items():
+            state = 0
+            for byte in pattern:
+                if byte not in goto[state]:
+                    goto.append({})
+                    values.append(None)
+                    goto[state][byte] = len(goto) - 1
+                state = goto[state][byte]
+            values[state] = value
+
+        # States in breadth-first order, so that a state's failure state, which
+        # is shallower, has its transitions filled in before its own
+        table = [0] * (256 * len(goto))
+        fail = [0] * len(goto)
+        queue = [0]
+        for state in queue:
+            for byte in range(256):
+                if byte in goto[state]:
+                    child = goto[state][byte]
+                    fail[child] = table[fail[state] * 256 + byte] if state else 0
+                    if values[child] is None and child != fail[child]:
+                        values[child] = values[fail[child]]
+                    queue.append(child)
+                    target = child
+                else:
+                    target = table[fail[state] * 256 + byte] if state else 0
+                table[state * 256 + byte] = target
+
+        # Stored premultiplied by 256, matches completed as ~value
+        return [
+            ~values[target] if values[target] is not None else target * 256
+            for target in table
+        ]
+
+    def first(self, line: bytes) -> int:
+        table = self.forward
+        state = 0
+        for byte in line:
+            state = table[state + byte]
+            if state < 0:
+                return ~state
+        raise ValueError(f"no digit in {line!r}")
+
+    def last(self, line: bytes) -> int:
+        table = self.backward
+        state = 0
+        for byte in reversed(line):
+            state = table[state + byte]
+            if state < 0:
+                return ~state
+        raise ValueError(f"no digit in {line!r}")
+
+    def calibration_value(self, line: bytes) -> int:
+        return 10 * self.first(line) + self.last(line)
+
+
+DIGITS = DigitAutomaton(words={})
+SPELLED_DIGITS = DigitAutomaton(
+    words={word: int(digit) for word, digit in digits_map.items()}, digits=b"123456789"
+)
+
+
+def read_byte_input(path) -> list[bytes]:
+    return list(read_byte_lines(path))
+
+
+def compute_part_one_automaton(lines: Iterable[bytes]) -> int:
+    return sum(DIGITS.calibration_value(line) for line in lines)
+
+
+def compute_part_two_automaton(lines: Iterable[bytes]) -> int:
+    return sum(SPELLED_DIGITS.calibration_value(line) for line in lines)
+
+
+def chunk_part_one(chunk: bytes) -> int:
+    return compute_part_one_automaton(chunk.splitlines())
+
+
+def chunk_part_two(chunk: bytes) -> int:
+    return compute_part_two_automaton(chunk.splitlines())
+
+
+def compute_part_one_parallel(mapped: MappedInput) -> int:
+    return sum(map_chunks(chunk_part_one, mapped.path))
+
+
+def compute_part_two_parallel(mapped: MappedInput) -> int:
+    return sum(map_chunks(chunk_part_two, mapped.path))
+
+
+ENGINES = {
+    "automaton": Engine(
+        read_input=read_byte_input,
+        compute_part_one=compute_part_one_automaton,
+        compute_part_two=compute_part_two_automaton,
+    ),
+    "parallel": Engine(
+        read_input=MappedInput,
+        compute_part_one=compute_part_one_parallel,
+        compute_part_two=compute_part_two_parallel,
+    ),
+}
 
 
 if __name__ == "__main__":
-    part1()
-    part2()
+    from sys import argv
+
+    path = argv[1] if len(argv) > 1 else "../input.txt"
+    print_answers(stream_input(path), compute_part_one, compute_part_two)
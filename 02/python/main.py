@@ -1,5 +1,19 @@
 #!/usr/bin/python3
+import sys
+from pathlib import Path
 from dataclasses import dataclass
+from math import prod
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.days import Engine
+from aoc.streams import read_lines
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @dataclass()
@@ -19,29 +33,46 @@ class Cubes:
         return self.blue * self.red * self.green
 
 
+Game = list[Cubes]
+
+
 def part_one(path):
+    print(compute_part_one(read_input(path)))
+
+
+def part_two(path):
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> list[tuple[int, Game]]:
+    return list(stream_input(path))
+
+
+def stream_input(path) -> Iterator[tuple[int, Game]]:
+    for line in read_lines(path):
+        yield parse_game(line)
+
+
+def compute_part_one(games: Iterable[tuple[int, Game]]) -> int:
     cubes_in_bag = Cubes(red=12, green=13, blue=14)
     res = 0
-    with open(path, "r") as f:
-        for line in f:
-            game_str, cubes_strs = line.split(":")
-            game_id = int(game_str.split()[1])
-            if all(
-                parse_cubes(cubes_str) <= cubes_in_bag
-                for cubes_str in cubes_strs.split(";")
-            ):
-                res += game_id
-    print(res)
+    for game_id, game in games:
+        if all(cubes <= cubes_in_bag for cubes in game):
+            res += game_id
+    return res
 
 
-def part_two(path):
+def compute_part_two(games: Iterable[tuple[int, Game]]) -> int:
     res = 0
-    with open(path, "r") as f:
-        for line in f:
-            cubes_strs = line.split(":")[1].split(";")
-            game = [parse_cubes(cubes_str) for cubes_str in cubes_strs]
-            res += smallest_including_bag(game).power()
-    print(res)
+    for _, game in games:
+        res += smallest_including_bag(game).power()
+    return res
+
+
+def parse_game(line: str) -> tuple[int, Game]:
+    game_str, cubes_strs = line.split(":")
+    game_id = int(game_str.split()[1])
+    return game_id, [parse_cubes(cubes_str) for cubes_str in cubes_strs.split(";")]
 
 
 def parse_cubes(cubes_string: str) -> Cubes:
@@ -60,7 +91,7 @@ def parse_cubes(cubes_string: str) -> Cubes:
     return res
 
 
-def smallest_including_bag(game: list[Cubes]):
+def smallest_including_bag(game: Game):
     res = Cubes()
     for cubes in game:
         if res.red < cubes.red:
@@ -72,6 +103,197 @@ def smallest_including_bag(game: list[Cubes]):
     return res
 
 
+def fold_game(line: str) -> tuple[int, int, int, int]:
+    """
+    Game id and largest numbers of red, green and blue cubes drawn, folded from
+    the words of the line without building its draws.
+    """
+    words = iter(line.split())
+    next(words)
+    game_id = int(next(words)[:-1])
+    red = green = blue = 0
+    for nb_str, color in zip(words, words):
+        nb = int(nb_str)
+        match color[0]:
+            case "r":
+                if red < nb:
+                    red = nb
+            case "g":
+                if green < nb:
+                    green = nb
+            case "b":
+                if blue < nb:
+                    blue = nb
+            case _:
+                raise ValueError((line, color))
+    return game_id, red, green, blue
+
+
+def compute_answers(
+    lines: Iterable[str], bag: tuple[int, int, int] = (12, 13, 14)
+) -> tuple[int, int]:
+    """
+    Answers of both parts in a single pass, for a bag of red, green and blue cubes.
+    """
+    max_red, max_green, max_blue = bag
+    id_sum = power_sum = 0
+    for line in lines:
+        game_id, red, green, blue = fold_game(line)
+        if red <= max_red and green <= max_green and blue <= max_blue:
+            id_sum += game_id
+        power_sum += red * green * blue
+    return id_sum, power_sum
+
+
+def read_raw_input(path) -> list[str]:
+    return list(read_lines(path))
+
+
+def compute_part_one_streaming(lines: Iterable[str]) -> int:
+    return compute_answers(lines)[0]
+
+
+def compute_part_two_streaming(lines: Iterable[str]) -> int:
+    return compute_answers(lines)[1]
+
+
+# Columns of the bags in a GameTable and in its queries
+COLORS = ("red", "green", "blue")
+# Cells above which a dominance table is not built, bags being checked in batches
+MAX_TABLE_CELLS = 1 << 22
+
+
+class GameTable:
+    """
+    Games as NumPy columns: their ids and the smallest bag including each, one
+    column per color of ``COLORS``. Queries take an ``(nb_bags, 3)`` array of
+    bags and answer for every bag at once.
+
+    A query sums a weight, such as the id, over the games whose smallest bag is
+    included in the queried bag. The sums are read from a 3D prefix-sum table
+    indexed by the distinct cube counts of each color, so that a query costs
+    three binary searches per bag whatever the number of games.
+    """
+
+    def __init__(self, ids: "np.ndarray", minimal_bags: "np.ndarray"):
+        import numpy as np
+
+        self.ids = ids
+        self.minimal_bags = minimal_bags
+        self.powers = minimal_bags.prod(axis=1)
+        # Distinct cube counts of each color, the coordinates of the tables
+        self.axes = [np.unique(column) for column in minimal_bags.T]
+        self._tables: dict[str, "np.ndarray"] = {}
+
+    @classmethod
+    def from_games(cls, games: Iterable[tuple[int, Game]]) -> "GameTable":
+        import numpy as np
+
+        ids: list[int] = []
+        minimal_bags: list[tuple[int, int, int]] = []
+        for game_id, game in games:
+            bag = smallest_including_bag(game)
+            ids.append(game_id)
+            minimal_bags.append((bag.red, bag.green, bag.blue))
+        return cls(
+            np.array(ids, dtype=np.int64),
+            np.array(minimal_bags, dtype=np.int64).reshape(-1, len(COLORS)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def possible_id_sums(self, bags) -> "np.ndarray":
+        """
+        For each bag, the sum of the ids of the games possible with it.
+        """
+        return self._possible_sums("ids", bags)
+
+    def power_sums(self, bags) -> "np.ndarray":
+        """
+        For each bag, the sum of the powers of the smallest bags of the games
+        possible with it.
+        """
+        return self._possible_sums("powers", bags)
+
+    def power_sum(self) -> int:
+        return int(self.powers.sum())
+
+    def _possible_sums(self, weights: str, bags) -> "np.ndarray":
+        import numpy as np
+
+        bags = np.asarray(bags, dtype=np.int64).reshape(-1, len(COLORS))
+        if prod(len(axis) + 1 for axis in self.axes) > MAX_TABLE_CELLS:
+            return self._checked_sums(getattr(self, weights), bags)
+        if weights not in self._tables:
+            self._tables[weights] = self._prefix_table(getattr(self, weights))
+        index = tuple(
+            np.searchsorted(axis, column, side="right")
+            for axis, column in zip(self.axes, bags.T)
+        )
+        return self._tables[weights][index]
+
+    def _prefix_table(self, weights: "np.ndarray") -> "np.ndarray":
+        """
+        Table whose cell (i, j, k) sums the weights of the games with at most the
+        i-th, j-th and k-th smallest counts of each color, 0 meaning none.
+        """
+        import numpy as np
+
+        table = np.zeros(tuple(len(axis) + 1 for axis in self.axes), dtype=np.int64)
+        cells = tuple(
+            np.searchsorted(axis, column) + 1
+            for axis, column in zip(self.axes, self.minimal_bags.T)
+        )
+        np.add.at(table, cells, weights)
+        for axis in range(table.ndim):
+            np.cumsum(table, axis=axis, out=table)
+        return table
+
+    def _checked_sums(self, weights: "np.ndarray", bags: "np.ndarray") -> "np.ndarray":
+        """
+        Same sums by comparing every game with every bag, in batches of bags that
+        bound the size of the comparison.
+        """
+        import numpy as np
+
+        res = np.empty(len(bags), dtype=np.int64)
+        batch_size = max(1, MAX_TABLE_CELLS // max(1, len(self)))
+        for start in range(0, len(bags), batch_size):
+            batch = bags[start : start + batch_size]
+            possible = (self.minimal_bags[None, :, :] <= batch[:, None, :]).all(axis=2)
+            res[start : start + batch_size] = possible @ weights
+        return res
+
+
+def read_table(path) -> GameTable:
+    return GameTable.from_games(stream_input(path))
+
+
+def compute_part_one_columnar(table: GameTable) -> int:
+    return int(table.possible_id_sums([(12, 13, 14)])[0])
+
+
+def compute_part_two_columnar(table: GameTable) -> int:
+    return table.power_sum()
+
+
+ENGINES = {
+    "streaming": Engine(
+        read_input=read_raw_input,
+        compute_part_one=compute_part_one_streaming,
+        compute_part_two=compute_part_two_streaming,
+    ),
+    "columnar": Engine(
+        read_input=read_table,
+        compute_part_one=compute_part_one_columnar,
+        compute_part_two=compute_part_two_columnar,
+    ),
+}
+
+
 if __name__ == "__main__":
-    part_one("../input.txt")
-    part_two("../input.txt")
+    from sys import argv
+
+    path = argv[1] if len(argv) > 1 else "../input.txt"
+    print(*compute_answers(read_lines(path)), sep="\n")
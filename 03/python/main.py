@@ -1,8 +1,22 @@
 #!/usr/bin/python3
+import sys
+from pathlib import Path
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Iterable, Iterator, Tuple
 import re
 
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.days import Engine
+from aoc.grid import Grid
+from aoc.profiling import phase
+from aoc.streams import read_byte_lines
+
+PART_PATTERN = re.compile(rb"(\d+|[^.])")
+GEAR_PATTERN = re.compile(rb"(\d+|\*)")
+
 
 @dataclass()
 class Number:
@@ -14,32 +28,52 @@ class Number:
     def is_adjacent(self, row: int, col: int):
         return -1 <= row - self.row <= 1 and -1 <= col - self.col <= self.width
 
+    def neighbourhood(self) -> Iterator[Tuple[int, int]]:
+        """
+        Cells of the box around the number, its own cells included.
+        """
+        for row in range(self.row - 1, self.row + 2):
+            for col in range(self.col - 1, self.col + self.width + 1):
+                yield (row, col)
+
 
 def part_one(path):
+    print(compute_part_one(read_input(path)))
+
+
+def part_two(path):
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> Grid:
+    return Grid.read(path)
+
+
+def compute_part_one(schematic: Grid) -> int:
     sum_part_numbers = 0
 
     numbers: list[Number] = []
     symbols: list[Tuple[int, int]] = []
-    pattern = re.compile(r"(\d+|[^.])")
-    with open(path, "r") as f:
-        for (row, line) in enumerate(f):
+    pattern = PART_PATTERN
+    with phase("build"):
+        for (row, line) in enumerate(schematic.rows()):
             parse_numbers_and_symbols(row, line, pattern, numbers, symbols)
 
     for number in numbers:
         if is_part(number, symbols):
             sum_part_numbers += number.val
 
-    print(sum_part_numbers)
+    return sum_part_numbers
 
 
-def part_two(path):
+def compute_part_two(schematic: Grid) -> int:
     sum_gear_ratios = 0
 
     numbers: list[Number] = []
     gears: list[Tuple[int, int]] = []
-    pattern = re.compile(r"(\d+|\*)")
-    with open(path, "r") as f:
-        for (row, line) in enumerate(f):
+    pattern = GEAR_PATTERN
+    with phase("build"):
+        for (row, line) in enumerate(schematic.rows()):
             parse_numbers_and_symbols(row, line, pattern, numbers, gears)
 
     for (row, col) in gears:
@@ -54,14 +88,14 @@ def part_two(path):
                 adjacent_to_current_gear[0].val * adjacent_to_current_gear[1].val
             )
 
-    print(sum_gear_ratios)
+    return sum_gear_ratios
 
 
 def parse_numbers_and_symbols(row, line, pattern, numbers, symbols):
-    for match_o in pattern.finditer(line.strip()):
+    for match_o in pattern.finditer(line):
         string = match_o.group()
         col_start, col_end = match_o.span()
-        if string[0].isdigit():
+        if string.isdigit():
             width = col_end - col_start
             numbers.append(Number(val=int(string), row=row, col=col_start, width=width))
         else:
@@ -72,6 +106,169 @@ def is_part(number: Number, symbols):
     return any(number.is_adjacent(row, col) for (row, col) in symbols)
 
 
+def compute_part_one_indexed(schematic: Grid) -> int:
+    sum_part_numbers = 0
+
+    numbers: list[Number] = []
+    symbols: list[Tuple[int, int]] = []
+    pattern = PART_PATTERN
+    with phase("build"):
+        for (row, line) in enumerate(schematic.rows()):
+            parse_numbers_and_symbols(row, line, pattern, numbers, symbols)
+        symbols_by_row = index_symbols(symbols)
+
+    for number in numbers:
+        if is_part_indexed(number, symbols_by_row):
+            sum_part_numbers += number.val
+
+    return sum_part_numbers
+
+
+def compute_part_two_indexed(schematic: Grid) -> int:
+    sum_gear_ratios = 0
+
+    numbers: list[Number] = []
+    gears: list[Tuple[int, int]] = []
+    pattern = GEAR_PATTERN
+    with phase("build"):
+        for (row, line) in enumerate(schematic.rows()):
+            parse_numbers_and_symbols(row, line, pattern, numbers, gears)
+        number_at = index_numbers(numbers)
+
+    for (row, col) in gears:
+        adjacent_to_current_gear = {
+            number_at[(neighbour_row, neighbour_col)]
+            for neighbour_row in range(row - 1, row + 2)
+            for neighbour_col in range(col - 1, col + 2)
+            if (neighbour_row, neighbour_col) in number_at
+        }
+        if len(adjacent_to_current_gear) == 2:
+            first, second = adjacent_to_current_gear
+            sum_gear_ratios += numbers[first].val * numbers[second].val
+
+    return sum_gear_ratios
+
+
+def index_symbols(symbols: list[Tuple[int, int]]) -> dict[int, set[int]]:
+    """
+    Columns of the symbols of each row.
+    """
+    symbols_by_row: dict[int, set[int]] = {}
+    for (row, col) in symbols:
+        symbols_by_row.setdefault(row, set()).add(col)
+    return symbols_by_row
+
+
+def index_numbers(numbers: list[Number]) -> dict[Tuple[int, int], int]:
+    """
+    Index in ``numbers`` of the number covering each cell covered by one.
+    """
+    number_at: dict[Tuple[int, int], int] = {}
+    for (i, number) in enumerate(numbers):
+        for col in range(number.col, number.col + number.width):
+            number_at[(number.row, col)] = i
+    return number_at
+
+
+def is_part_indexed(number: Number, symbols_by_row: dict[int, set[int]]):
+    return any(
+        col in symbols_by_row.get(row, ())
+        for (row, col) in number.neighbourhood()
+    )
+
+
+@dataclass()
+class Row:
+    numbers: list[Number]
+    symbols: set[int]
+    # Index in numbers of the number covering each column covered by one
+    number_at: dict[int, int]
+
+    def numbers_near(self, col: int) -> list[Number]:
+        number_at = self.number_at
+        indices = {number_at[c] for c in (col - 1, col, col + 1) if c in number_at}
+        return [self.numbers[i] for i in indices]
+
+    def has_symbol_near(self, number: Number) -> bool:
+        return any(
+            col in self.symbols
+            for col in range(number.col - 1, number.col + number.width + 1)
+        )
+
+
+EMPTY_ROW = Row(numbers=[], symbols=set(), number_at={})
+
+
+def parse_row(row: int, line: bytes, pattern) -> Row:
+    numbers: list[Number] = []
+    symbols: list[Tuple[int, int]] = []
+    parse_numbers_and_symbols(row, line.rstrip(b"\r\n"), pattern, numbers, symbols)
+    number_at = {
+        col: i
+        for (i, number) in enumerate(numbers)
+        for col in range(number.col, number.col + number.width)
+    }
+    return Row(numbers, {col for (_, col) in symbols}, number_at)
+
+
+def row_windows(lines: Iterable[bytes], pattern) -> Iterator[Tuple[Row, Row, Row]]:
+    """
+    Every row with the rows above and below it, empty past the edges.
+    A row is yielded as soon as the one below it is parsed, and only these
+    three rows are held at a time.
+    """
+    above, current = EMPTY_ROW, None
+    for (i, line) in enumerate(lines):
+        below = parse_row(i, line, pattern)
+        if current is not None:
+            yield above, current, below
+            above = current
+        current = below
+    if current is not None:
+        yield above, current, EMPTY_ROW
+
+
+def part_numbers(lines: Iterable[bytes]) -> Iterator[int]:
+    for (above, row, below) in row_windows(lines, PART_PATTERN):
+        for number in row.numbers:
+            if any(r.has_symbol_near(number) for r in (above, row, below)):
+                yield number.val
+
+
+def gear_ratios(lines: Iterable[bytes]) -> Iterator[int]:
+    for (above, row, below) in row_windows(lines, GEAR_PATTERN):
+        for col in row.symbols:
+            adjacent = [n for r in (above, row, below) for n in r.numbers_near(col)]
+            if len(adjacent) == 2:
+                yield adjacent[0].val * adjacent[1].val
+
+
+def read_byte_input(path) -> list[bytes]:
+    return list(read_byte_lines(path))
+
+
+def compute_part_one_streaming(lines: Iterable[bytes]) -> int:
+    return sum(part_numbers(lines))
+
+
+def compute_part_two_streaming(lines: Iterable[bytes]) -> int:
+    return sum(gear_ratios(lines))
+
+
+ENGINES = {
+    "indexed": Engine(
+        read_input=read_input,
+        compute_part_one=compute_part_one_indexed,
+        compute_part_two=compute_part_two_indexed,
+    ),
+    "streaming": Engine(
+        read_input=read_byte_input,
+        compute_part_one=compute_part_one_streaming,
+        compute_part_two=compute_part_two_streaming,
+    ),
+}
+
+
 if __name__ == "__main__":
     part_one("../input.txt")
     part_two("../input.txt")
@@ -1,40 +1,119 @@
+from pathlib import Path
+import os
+import sys
 from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.chunks import MappedInput, map_chunks
+from aoc.days import Engine
+from aoc.streams import print_answers, read_lines
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Cards scored per vectorized call of the bitmask engine
+CHUNK_SIZE = 1 << 12
+
+# Cards between two reports of the running total of part two, 0 for none
+PROGRESS_EVERY = int(os.environ.get("AOC_PROGRESS_EVERY") or 0)
 
 
 def part_one(path):
+    print(compute_part_one(read_input(path)))
+
+
+def part_two(path):
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> list[str]:
+    return list(stream_input(path))
+
+
+def stream_input(path) -> Iterator[str]:
+    return read_lines(path)
+
+
+def compute_part_one(cards: Iterable[str]) -> int:
     total_points = 0
 
-    with open(path, "r") as f:
-        for line in f:
-            nb_winning_numbers = nb_winning(line)
-            if nb_winning_numbers:
-                total_points += 2 ** (nb_winning_numbers - 1)
+    for line in cards:
+        nb_winning_numbers = nb_winning(line)
+        if nb_winning_numbers:
+            total_points += 2 ** (nb_winning_numbers - 1)
 
-    print(total_points)
+    return total_points
 
 
-def part_two(path):
+def compute_part_two(cards: Iterable[str]) -> int:
     nb_cards = 0
 
     copies = deque()
-    with open(path, "r") as f:
-        for line in f:
-            nb_copies = 1
+    for line in cards:
+        nb_copies = 1
+        try:
+            nb_copies += copies.popleft()
+        except IndexError:
+            pass
+        nb_cards += nb_copies
+
+        nb_winning_numbers = nb_winning(line)
+
+        for i in range(nb_winning_numbers):
             try:
-                nb_copies += copies.popleft()
+                copies[i] += nb_copies
             except IndexError:
-                pass
-            nb_cards += nb_copies
+                copies.append(nb_copies)
+
+    return nb_cards
 
-            nb_winning_numbers = nb_winning(line)
 
-            for i in range(nb_winning_numbers):
-                try:
-                    copies[i] += nb_copies
-                except IndexError:
-                    copies.append(nb_copies)
+def compute_part_two_difference(cards: Iterable[str]) -> int:
+    return propagate_copies(nb_winning(line) for line in cards)
 
-    print(nb_cards)
+
+def propagate_copies(
+    match_counts: Iterable[int], progress_every: int = PROGRESS_EVERY
+) -> int:
+    """
+    Total number of cards once the copies won by every card, given its number
+    of matches, are added. With ``progress_every``, $AOC_PROGRESS_EVERY by
+    default, the running total is reported on stderr every that many cards.
+    """
+    nb_cards = 0
+    for (i, nb_cards) in enumerate(running_card_totals(match_counts), 1):
+        if progress_every and i % progress_every == 0:
+            print(f"{i} cards read, {nb_cards} cards in total", file=sys.stderr)
+    return nb_cards
+
+
+def running_card_totals(match_counts: Iterable[int]) -> Iterator[int]:
+    """
+    Number of cards, copies included, after each card.
+    A card with n copies and m matches adds n copies to each of the next m
+    cards, i.e. n at the next card and -n m cards further in a difference
+    array whose running sum is the number of copies won. Only the part of the
+    array ahead of the current card is kept.
+    """
+    nb_cards = 0
+    copies_won = 0
+    ahead: deque[int] = deque()
+    for nb_winning_numbers in match_counts:
+        if ahead:
+            copies_won += ahead.popleft()
+        nb_copies = 1 + copies_won
+        nb_cards += nb_copies
+        if nb_winning_numbers:
+            if len(ahead) <= nb_winning_numbers:
+                ahead.extend([0] * (nb_winning_numbers + 1 - len(ahead)))
+            ahead[0] += nb_copies
+            ahead[nb_winning_numbers] -= nb_copies
+        yield nb_cards
 
 
 def nb_winning(line):
@@ -48,6 +127,130 @@ def nb_winning(line):
     return res
 
 
+def number_masks(numbers: "np.ndarray", nb_words: int) -> "np.ndarray":
+    """
+    One bitmask per row of ``numbers``, as ``nb_words`` uint64 words with bit
+    ``n % 64`` of word ``n // 64`` set for every number n of the row.
+    """
+    import numpy as np
+
+    masks = np.zeros((len(numbers), nb_words), dtype=np.uint64)
+    rows = np.repeat(np.arange(len(numbers)), numbers.shape[1])
+    words = (numbers >> 6).ravel()
+    bits = np.left_shift(np.uint64(1), (numbers & 63).astype(np.uint64)).ravel()
+    np.bitwise_or.at(masks, (rows, words), bits)
+    return masks
+
+
+def batch_match_counts(lines: list[str]) -> "np.ndarray":
+    """
+    Numbers of matches of a batch of cards, as ``nb_winning`` counts them.
+    The bitmasks need every card of the batch to have as many winning numbers
+    and as many numbers of mine: batches mixing layouts are counted with
+    ``nb_winning``, as are the cards where a number of mine is repeated.
+    """
+    import numpy as np
+
+    # -1 marks the bar and -2 the end of each card in a single parse
+    numbers_text = " ".join(
+        line[line.index(":") + 1 :].replace("|", " -1 ") + " -2" for line in lines
+    )
+    numbers = np.fromstring(numbers_text, dtype=np.int64, sep=" ")
+    ends = np.flatnonzero(numbers == -2)
+    bars = np.flatnonzero(numbers == -1)
+    width = int(ends[0]) + 1
+    card_starts = np.arange(len(lines)) * width
+    if (
+        len(numbers) != len(lines) * width
+        or len(bars) != len(lines)
+        or not (ends == card_starts + width - 1).all()
+        or not (bars == card_starts + bars[0]).all()
+    ):
+        return np.array([nb_winning(line) for line in lines], dtype=np.int64)
+
+    numbers = numbers.reshape(len(lines), width)
+    nb_winning_numbers = int(bars[0])
+    nb_words = max(0, int(numbers.max())) // 64 + 1
+    winning = number_masks(numbers[:, :nb_winning_numbers], nb_words)
+    mine = number_masks(numbers[:, nb_winning_numbers + 1 : -1], nb_words)
+    counts = np.bitwise_count(winning & mine).sum(axis=1, dtype=np.int64)
+    # A repeated number of mine sets its bit once but counts every time
+    nb_mine = width - nb_winning_numbers - 2
+    repeated = np.bitwise_count(mine).sum(axis=1) != nb_mine
+    for i in np.flatnonzero(repeated).tolist():
+        counts[i] = nb_winning(lines[i])
+    return counts
+
+
+def match_count_batches(
+    cards: Iterable[str], chunk_size: int = CHUNK_SIZE
+) -> Iterator["np.ndarray"]:
+    cards = iter(cards)
+    while lines := list(islice(cards, chunk_size)):
+        yield batch_match_counts(lines)
+
+
+def points(counts: "np.ndarray") -> int:
+    import numpy as np
+
+    winners = counts[counts > 0]
+    return int(np.left_shift(1, winners - 1).sum())
+
+
+def compute_part_one_bitmask(cards: Iterable[str]) -> int:
+    return sum(points(counts) for counts in match_count_batches(cards))
+
+
+def compute_part_two_bitmask(cards: Iterable[str]) -> int:
+    return propagate_copies(
+        count for counts in match_count_batches(cards) for count in counts.tolist()
+    )
+
+
+def chunk_match_counts(chunk: bytes) -> "np.ndarray":
+    import numpy as np
+
+    batches = list(match_count_batches(chunk.decode().splitlines()))
+    return np.concatenate(batches) if batches else np.zeros(0, dtype=np.int64)
+
+
+def chunk_points(chunk: bytes) -> int:
+    return points(chunk_match_counts(chunk))
+
+
+def compute_part_one_parallel(mapped: MappedInput) -> int:
+    return sum(map_chunks(chunk_points, mapped.path))
+
+
+def compute_part_two_parallel(mapped: MappedInput) -> int:
+    match_counts = (
+        count
+        for counts in map_chunks(chunk_match_counts, mapped.path)
+        for count in counts.tolist()
+    )
+    return propagate_copies(match_counts)
+
+
+ENGINES = {
+    "difference": Engine(
+        read_input=read_input,
+        compute_part_two=compute_part_two_difference,
+    ),
+    "bitmask": Engine(
+        read_input=read_input,
+        compute_part_one=compute_part_one_bitmask,
+        compute_part_two=compute_part_two_bitmask,
+    ),
+    "parallel": Engine(
+        read_input=MappedInput,
+        compute_part_one=compute_part_one_parallel,
+        compute_part_two=compute_part_two_parallel,
+    ),
+}
+
+
 if __name__ == "__main__":
-    part_one("../input.txt")
-    part_two("../input.txt")
+    from sys import argv
+
+    path = argv[1] if len(argv) > 1 else "../input.txt"
+    print_answers(stream_input(path), compute_part_one, compute_part_two)
@@ -1,20 +1,207 @@
-import portion as P
-from typing import Tuple
+import sys
+from pathlib import Path
+from bisect import bisect_right
+from functools import reduce
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, Tuple
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.days import Engine
+from aoc.intervals import IntervalSet
+from aoc.profiling import phase
+from aoc.reader import blocks
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Values mapped per vectorized call by PiecewiseTranslation.map_batches
+BATCH_SIZE = 1 << 16
+
+
+# (destination start, source start, range length) lines of a map block
+Map = list[Tuple[int, int, int]]
+
+
+class PiecewiseTranslation:
+    """
+    Function of the integers translating x by ``translations[i]`` when x is in
+    [starts[i], starts[i + 1]), the last piece having no upper bound, and leaving
+    x below ``starts[0]`` unchanged. Consecutive pieces have different
+    translations, so that a function has a single table.
+    """
+
+    __slots__ = ("starts", "translations", "_arrays")
+
+    def __init__(
+        self, starts: list[int] | None = None, translations: list[int] | None = None
+    ):
+        self.starts = starts if starts is not None else []
+        self.translations = translations if translations is not None else []
+        # NumPy copies of the table, built by map_array on its first call
+        self._arrays: tuple["np.ndarray", "np.ndarray"] | None = None
+
+    @classmethod
+    def from_map(cls, current_map: Map) -> "PiecewiseTranslation":
+        pieces: list[Tuple[int, int]] = []
+        end = None
+        for (dest_low, orig_low, rng) in sorted(current_map, key=lambda line: line[1]):
+            if end is not None and end < orig_low:
+                pieces.append((end, 0))
+            pieces.append((orig_low, dest_low - orig_low))
+            end = orig_low + rng
+        if end is not None:
+            pieces.append((end, 0))
+        return cls._coalesced(pieces)
+
+    @classmethod
+    def _coalesced(cls, pieces: Iterable[Tuple[int, int]]) -> "PiecewiseTranslation":
+        """
+        Function from (start, translation) pieces sorted by start, a piece
+        replacing a previous one with the same start.
+        """
+        starts: list[int] = []
+        translations: list[int] = []
+        for (start, translation) in pieces:
+            if starts and starts[-1] == start:
+                starts.pop()
+                translations.pop()
+            if translation != (translations[-1] if translations else 0):
+                starts.append(start)
+                translations.append(translation)
+        return cls(starts, translations)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.starts, self.translations)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __call__(self, x: int) -> int:
+        return x + self._translation(bisect_right(self.starts, x) - 1)
+
+    def _translation(self, i: int) -> int:
+        return self.translations[i] if i >= 0 else 0
+
+    def map_array(self, xs: "np.ndarray") -> "np.ndarray":
+        """
+        Images of an int64 array, with one binary search for all of them.
+        """
+        import numpy as np
+
+        if self._arrays is None:
+            starts = np.array(self.starts, dtype=np.int64)
+            # Shifted by one so that values below the first start get translation 0
+            translations = np.array([0, *self.translations], dtype=np.int64)
+            self._arrays = starts, translations
+        starts, translations = self._arrays
+        return xs + translations[np.searchsorted(starts, xs, side="right")]
+
+    def map_batches(
+        self, xs: Iterable[int], batch_size: int = BATCH_SIZE
+    ) -> Iterator["np.ndarray"]:
+        """
+        Images of ``xs`` in arrays of ``batch_size``, reading ``xs`` lazily so
+        that memory does not grow with its length.
+        """
+        import numpy as np
+
+        if isinstance(xs, np.ndarray):
+            for start in range(0, len(xs), batch_size):
+                yield self.map_array(xs[start : start + batch_size])
+            return
+        xs = iter(xs)
+        while len(batch := np.fromiter(islice(xs, batch_size), dtype=np.int64)):
+            yield self.map_array(batch)
+
+    def then(self, other: "PiecewiseTranslation") -> "PiecewiseTranslation":
+        """
+        Composition ``x -> other(self(x))``. Every piece of ``self`` is cut where
+        its image crosses a start of ``other``.
+        """
+        first_start = self.starts[0] if self.starts else None
+        pieces = [
+            (start, translation)
+            for (start, translation) in other
+            if first_start is None or start < first_start
+        ]
+        nb_other = len(other.starts)
+        for (i, (start, translation)) in enumerate(self):
+            end = self.starts[i + 1] if i + 1 < len(self.starts) else None
+            j = bisect_right(other.starts, start + translation) - 1
+            pieces.append((start, translation + other._translation(j)))
+            j += 1
+            while j < nb_other and (end is None or other.starts[j] < end + translation):
+                pieces.append(
+                    (other.starts[j] - translation, translation + other.translations[j])
+                )
+                j += 1
+        return self._coalesced(pieces)
+
+    def pieces(self, low: int, high: int) -> Iterator[Tuple[int, int, int]]:
+        """
+        (low, high, translation) of the parts of [low, high] on each piece.
+        """
+        i = bisect_right(self.starts, low) - 1
+        while low <= high:
+            end = self.starts[i + 1] - 1 if i + 1 < len(self.starts) else high
+            yield low, min(end, high), self._translation(i)
+            low = end + 1
+            i += 1
+
+    def minimum(self, intervals: IntervalSet) -> int:
+        """
+        Smallest image of the integers of ``intervals``. The function increases
+        on each piece, so only the lowest value of each part is tried.
+        """
+        return min(
+            piece_low + translation
+            for (low, high) in intervals
+            for (piece_low, _, translation) in self.pieces(low, high)
+        )
+
+
+# Seeds and the maps, in the order they apply
+Almanac = tuple[list[int], list[Map]]
+
+# Seeds and the composition of all the maps, from seed to location
+ComposedAlmanac = tuple[list[int], PiecewiseTranslation]
 
 
 def part_one(path):
-    with open(path, "r") as f:
-        file_blocks = f.read().split("\n\n")
+    print(compute_part_one(read_input(path)))
 
-    seeds = [int(seed_str) for seed_str in file_blocks[0].split(":")[1].split()]
 
-    intervals = []
-    for block in file_blocks[1:]:
-        current_interval = []
-        for line in block.split("\n")[1:]:
+def part_two(path):
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> Almanac:
+    file_blocks = blocks(path)
+
+    seeds = [int(seed_str) for seed_str in next(file_blocks).split(b":")[1].split()]
+
+    maps = []
+    for block in file_blocks:
+        current_map = []
+        for line in block.split(b"\n")[1:]:
             if not line.strip():
                 continue
             dest_low, orig_low, rng = map(int, line.split())
+            current_map.append((dest_low, orig_low, rng))
+        maps.append(current_map)
+    return seeds, maps
+
+
+def compute_part_one(almanac: Almanac) -> int:
+    seeds, maps = almanac
+
+    intervals = []
+    for current_map in maps:
+        current_interval = []
+        for (dest_low, orig_low, rng) in current_map:
             current_interval.append((orig_low, orig_low + rng - 1, dest_low - orig_low))
         current_interval.sort()
         intervals.append(current_interval)
@@ -31,59 +218,83 @@ def part_one(path):
                     break
         if min_location is None or min_location > location:
             min_location = location
-    print(min_location)
+    return min_location
 
 
-def part_two(path):
-    with open(path, "r") as f:
-        file_blocks = f.read().split("\n\n")
-
-    seeds_interval: P.Interval = P.empty()
-    seeds_strs = file_blocks[0].split(":")[1].split()
-    for i in range(0, len(seeds_strs), 2):
-        low = int(seeds_strs[i])
-        high = low + int(seeds_strs[i + 1]) - 1
-        seeds_interval: P.Interval = seeds_interval | P.closed(low, high)
-
-    intervals_translations_list: list[list[Tuple[P.Interval, int]]] = []
-    unions_of_intervals: list[P.Interval] = []
-    for block in file_blocks[1:]:
-        current_union_of_intervals = P.empty()
-        current_intervals_translations = []
-        for line in block.split("\n")[1:]:
-            if not line.strip():
-                continue
-            dest_low, orig_low, rng = map(int, line.split())
-            origin_interval = P.closed(orig_low, orig_low + rng - 1)
-            current_union_of_intervals = current_union_of_intervals | origin_interval
-            current_intervals_translations.append(
-                (origin_interval, dest_low - orig_low)
+def compute_part_two(almanac: Almanac) -> int:
+    seeds, maps = almanac
+
+    seeds_interval = IntervalSet.from_pairs(
+        (seeds[i], seeds[i] + seeds[i + 1] - 1) for i in range(0, len(seeds), 2)
+    )
+
+    intervals_translations_list: list[list[Tuple[IntervalSet, int]]] = []
+    unions_of_intervals: list[IntervalSet] = []
+    with phase("build"):
+        for current_map in maps:
+            current_intervals_translations = [
+                (IntervalSet.closed(orig_low, orig_low + rng - 1), dest_low - orig_low)
+                for (dest_low, orig_low, rng) in current_map
+            ]
+            intervals_translations_list.append(current_intervals_translations)
+            unions_of_intervals.append(
+                IntervalSet.union_all(
+                    interval for (interval, _) in current_intervals_translations
+                )
             )
-        intervals_translations_list.append(current_intervals_translations)
-        unions_of_intervals.append(current_union_of_intervals)
 
     locations_interval = seeds_interval
     for (union_of_intervals, intervals_translations) in zip(
         unions_of_intervals, intervals_translations_list
     ):
         diff = locations_interval - union_of_intervals
-        translated_intervals = P.empty()
-        for (interval, translation) in intervals_translations:
-            translated_intervals = translated_intervals | translate_interval(
-                locations_interval & interval, translation
-            )
+        translated_intervals = IntervalSet.union_all(
+            (locations_interval & interval).shifted(translation)
+            for (interval, translation) in intervals_translations
+        )
         locations_interval = diff | translated_intervals
 
-    print(locations_interval.lower)
+    return locations_interval.lower
+
 
+def read_composed(path) -> ComposedAlmanac:
+    seeds, maps = read_input(path)
+    with phase("build"):
+        location = reduce(
+            PiecewiseTranslation.then,
+            map(PiecewiseTranslation.from_map, maps),
+            PiecewiseTranslation(),
+        )
+    return seeds, location
 
-def translate_interval(interval, translation):
-    def translate_bound(bound):
-        return bound + translation
 
-    return interval.apply(
-        lambda x: x.replace(upper=translate_bound, lower=translate_bound)
+def compute_part_one_composed(almanac: ComposedAlmanac) -> int:
+    seeds, location = almanac
+    return min(location(seed) for seed in seeds)
+
+
+def compute_part_two_composed(almanac: ComposedAlmanac) -> int:
+    seeds, location = almanac
+
+    seeds_interval = IntervalSet.from_pairs(
+        (seeds[i], seeds[i] + seeds[i + 1] - 1) for i in range(0, len(seeds), 2)
     )
+    return location.minimum(seeds_interval)
+
+
+def compute_part_one_numpy(almanac: ComposedAlmanac) -> int:
+    seeds, location = almanac
+    return min(int(batch.min()) for batch in location.map_batches(seeds))
+
+
+ENGINES = {
+    "composed": Engine(
+        read_input=read_composed,
+        compute_part_one=compute_part_one_composed,
+        compute_part_two=compute_part_two_composed,
+    ),
+    "numpy": Engine(read_input=read_composed, compute_part_one=compute_part_one_numpy),
+}
 
 
 if __name__ == "__main__":
@@ -1,30 +1,66 @@
-from math import sqrt, ceil, floor, prod
+import sys
+from pathlib import Path
+from dataclasses import dataclass
+from math import isqrt, sqrt, ceil, floor, prod
+from typing import TYPE_CHECKING, Sequence
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.days import Engine
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Largest duration and record of the float64 fast path of
+# compute_nb_solutions_batch: the discriminant then stays below 2**53, where
+# float64 holds integers exactly and int64 products cannot overflow
+FLOAT_MAX_DURATION = 2**26
+FLOAT_MAX_RECORD = 2**50
+
+
+@dataclass()
+class Races:
+    durations: list[int]
+    records: list[int]
+    # Race of part two, whose numbers are the digits of all the races put together
+    duration: int
+    record: int
 
 
 def part_one(path):
+    print(compute_part_one(read_input(path)))
+
+
+def part_two(path):
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> Races:
     with open(path, "r") as f:
         file_lines = f.readlines()
 
-    durations = [
-        int(duration_str) for duration_str in file_lines[0].split(":")[1].split()
-    ]
-    records = [int(record_str) for record_str in file_lines[1].split(":")[1].split()]
+    durations_strs = file_lines[0].split(":")[1].split()
+    records_strs = file_lines[1].split(":")[1].split()
+    return Races(
+        durations=[int(duration_str) for duration_str in durations_strs],
+        records=[int(record_str) for record_str in records_strs],
+        duration=int("".join(durations_strs)),
+        record=int("".join(records_strs)),
+    )
+
 
+def compute_part_one(races: Races) -> int:
     prod_solutions = prod(
         compute_nb_solutions(duration=duration, record=record)
-        for (duration, record) in zip(durations, records)
+        for (duration, record) in zip(races.durations, races.records)
     )
-    print(prod_solutions)
-
+    return prod_solutions
 
-def part_two(path):
-    with open(path, "r") as f:
-        file_lines = f.readlines()
 
-    duration = int(file_lines[0].split(":")[1].replace(" ", ""))
-    record = int(file_lines[1].split(":")[1].replace(" ", ""))
-
-    print(compute_nb_solutions(duration=duration, record=record))
+def compute_part_two(races: Races) -> int:
+    return compute_nb_solutions(duration=races.duration, record=races.record)
 
 
 def compute_nb_solutions(duration: int, record: int):
@@ -44,6 +80,116 @@ def compute_nb_solutions(duration: int, record: int):
     return nb_solutions
 
 
+def compute_part_one_exact(races: Races) -> int:
+    return prod(
+        compute_nb_solutions_exact(duration=duration, record=record)
+        for (duration, record) in zip(races.durations, races.records)
+    )
+
+
+def compute_part_two_exact(races: Races) -> int:
+    return compute_nb_solutions_exact(duration=races.duration, record=races.record)
+
+
+def compute_nb_solutions_exact(duration: int, record: int) -> int:
+    """
+    Number of hold times h in [0, duration] with h * (duration - h) > record,
+    in exact integer arithmetic whatever the size of the numbers.
+    The winning hold times lie strictly between the roots
+    (duration +- sqrt(delta)) / 2 and are symmetric around duration / 2, so the
+    count follows from the shortest winning hold. ``(duration - isqrt(delta)) // 2``
+    is that hold or the one just before it.
+    """
+    delta = duration**2 - 4 * record
+    if delta < 0:
+        return 0
+    hold_min = max(0, (duration - isqrt(delta)) // 2)
+    if hold_min * (duration - hold_min) <= record:
+        hold_min += 1
+    return max(0, duration - 2 * hold_min + 1)
+
+
+def compute_nb_solutions_batch(
+    durations: Sequence[int], records: Sequence[int]
+) -> list[int]:
+    """
+    ``compute_nb_solutions_exact`` of many races at once. Races small enough for
+    float64 are solved in one vectorized pass, the others exactly one by one.
+    """
+    import numpy as np
+
+    try:
+        duration = np.asarray(durations, dtype=np.int64)
+        record = np.asarray(records, dtype=np.int64)
+    except OverflowError:
+        # Some numbers do not fit in int64, those races get zeros in the arrays
+        fits = [
+            0 <= duration <= FLOAT_MAX_DURATION and 0 <= record <= FLOAT_MAX_RECORD
+            for (duration, record) in zip(durations, records)
+        ]
+        duration = np.array(
+            [d if f else 0 for (d, f) in zip(durations, fits)], dtype=np.int64
+        )
+        record = np.array(
+            [r if f else 0 for (r, f) in zip(records, fits)], dtype=np.int64
+        )
+        fast = np.array(fits, dtype=bool)
+    else:
+        fast = (duration >= 0) & (duration <= FLOAT_MAX_DURATION)
+        fast &= (record >= 0) & (record <= FLOAT_MAX_RECORD)
+
+    res = np.zeros(len(fast), dtype=np.int64)
+    res[fast] = nb_solutions_float64(duration[fast], record[fast])
+    if fast.all():
+        return res.tolist()
+    nb_solutions = res.tolist()
+    for i in np.flatnonzero(~fast).tolist():
+        nb_solutions[i] = compute_nb_solutions_exact(durations[i], records[i])
+    return nb_solutions
+
+
+def nb_solutions_float64(duration: "np.ndarray", record: "np.ndarray") -> "np.ndarray":
+    """
+    ``compute_nb_solutions_exact`` of int64 arrays of races within the float64 limits.
+    """
+    import numpy as np
+
+    delta = duration * duration - 4 * record
+    square = np.maximum(delta, 0)
+    # The float square root is correctly rounded, hence off by at most one
+    root = np.floor(np.sqrt(square.astype(np.float64))).astype(np.int64)
+    root -= root * root > square
+    root += (root + 1) * (root + 1) <= square
+    hold_min = (duration - root) // 2
+    hold_min += hold_min * (duration - hold_min) <= record
+    nb_solutions = np.maximum(0, duration - 2 * hold_min + 1)
+    nb_solutions[delta < 0] = 0
+    return nb_solutions
+
+
+def compute_part_one_batch(races: Races) -> int:
+    return prod(compute_nb_solutions_batch(races.durations, races.records))
+
+
+def compute_part_two_batch(races: Races) -> int:
+    (nb_solutions,) = compute_nb_solutions_batch([races.duration], [races.record])
+    return nb_solutions
+
+
+ENGINES = {
+    "exact": Engine(
+        read_input=read_input,
+        compute_part_one=compute_part_one_exact,
+        compute_part_two=compute_part_two_exact,
+    ),
+    "batch": Engine(
+        read_input=read_input,
+        compute_part_one=compute_part_one_batch,
+        compute_part_two=compute_part_two_batch,
+    ),
+}
+
+
 if __name__ == "__main__":
     part_one("../input.txt")
     part_two("../input.txt")
@@ -1,14 +1,42 @@
+import sys
+from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 from collections import Counter
+from typing import Iterable, Iterator
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.profiling import phase
+from aoc.streams import print_answers, read_lines
 
 
 def part_one(path):
-    solve(path=path, joker=False)
+    print(compute_part_one(read_input(path)))
 
 
 def part_two(path):
-    solve(path=path, joker=True)
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> list[tuple[str, int]]:
+    return list(stream_input(path))
+
+
+def stream_input(path) -> Iterator[tuple[str, int]]:
+    for line in read_lines(path):
+        hand_str, bid_str = line.split()
+        yield hand_str, int(bid_str)
+
+
+def compute_part_one(hands_strs_bids: Iterable[tuple[str, int]]) -> int:
+    return solve(hands_strs_bids=hands_strs_bids, joker=False)
+
+
+def compute_part_two(hands_strs_bids: Iterable[tuple[str, int]]) -> int:
+    return solve(hands_strs_bids=hands_strs_bids, joker=True)
 
 
 class Label(Enum):
@@ -152,25 +180,25 @@ class HandJoker:
         return HandJoker(type_=hand_type, labels=labels_joker)
 
 
-def solve(path, joker):
+def solve(hands_strs_bids: Iterable[tuple[str, int]], joker: bool) -> int:
     hands_bids = []
 
-    with open(path, "r") as f:
-        for line in f:
-            hand_str, bid_str = line.split()
+    with phase("build"):
+        for hand_str, bid in hands_strs_bids:
             labels = tuple(Label(char) for char in hand_str)
             hand = Hand.from_labels(labels)
             if joker:
                 hand = HandJoker.from_hand(hand)
-            bid = int(bid_str)
             hands_bids.append((hand, bid))
 
     hands_bids.sort(key=lambda x: x[0])
 
     res = sum(bid * (i + 1) for (i, (_, bid)) in enumerate(hands_bids))
-    print(res)
+    return res
 
 
 if __name__ == "__main__":
-    part_one("../input.txt")
-    part_two("../input.txt")
+    from sys import argv
+
+    path = argv[1] if len(argv) > 1 else "../input.txt"
+    print_answers(stream_input(path), compute_part_one, compute_part_two)
@@ -2,19 +2,33 @@ from itertools import cycle
 from math import lcm
 
 
+Graph = dict[str, tuple[str, str]]
+
+
 def part_one(path):
-    graph, directions = read_graph_directions(path=path)
+    print(compute_part_one(read_input(path)))
+
+
+def part_two(path):
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> tuple[Graph, str]:
+    return read_graph_directions(path=path)
+
+
+def compute_part_one(graph_directions: tuple[Graph, str]) -> int:
+    graph, directions = graph_directions
     position = "AAA"
 
     for (steps, direction) in enumerate(cycle(directions)):
         if position == "ZZZ":
-            print(steps)
-            break
+            return steps
         position = next_position(position=position, direction=direction, graph=graph)
 
 
-def part_two(path):
-    graph, directions = read_graph_directions(path=path)
+def compute_part_two(graph_directions: tuple[Graph, str]) -> int:
+    graph, directions = graph_directions
 
     positions = [position for position in graph if position.endswith("A")]
     positions_steps = []
@@ -25,10 +39,10 @@ def part_two(path):
                 positions_steps.append(steps)
                 break
             position = next_position(position, direction, graph)
-    print(lcm(*positions_steps))
+    return lcm(*positions_steps)
 
 
-def read_graph_directions(path) -> tuple[dict[str, tuple[str, str]], str]:
+def read_graph_directions(path) -> tuple[Graph, str]:
     with open(path, "r") as f:
         file_lines = f.read().split("\n")
     directions = file_lines[0]
@@ -46,9 +60,7 @@ def read_graph_directions(path) -> tuple[dict[str, tuple[str, str]], str]:
     return graph, directions
 
 
-def next_position(
-    position: str, direction: str, graph: dict[str, tuple[str, str]]
-) -> str:
+def next_position(position: str, direction: str, graph: Graph) -> str:
     if direction == "L":
         return graph[position][0]
     else:
@@ -1,21 +1,44 @@
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.streams import print_answers, read_lines
+
+
 def part_one(path):
+    print(compute_part_one(read_input(path)))
+
+
+def part_two(path):
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> list[list[int]]:
+    return list(stream_input(path))
+
+
+def stream_input(path) -> Iterator[list[int]]:
+    return ([int(word) for word in line.split()] for line in read_lines(path))
+
+
+def compute_part_one(histories: Iterable[list[int]]) -> int:
     sum_predicted_values = 0
-    with open(path, "r") as f:
-        for line in f:
-            history = [int(word) for word in line.split()]
-            sum_predicted_values += predict_next_value(history)
+    for history in histories:
+        sum_predicted_values += predict_next_value(history)
 
-    print(sum_predicted_values)
+    return sum_predicted_values
 
 
-def part_two(path):
+def compute_part_two(histories: Iterable[list[int]]) -> int:
     sum_predicted_values = 0
-    with open(path, "r") as f:
-        for line in f:
-            history = [int(word) for word in line.split()]
-            sum_predicted_values += predict_previous_value(history)
+    for history in histories:
+        sum_predicted_values += predict_previous_value(history)
 
-    print(sum_predicted_values)
+    return sum_predicted_values
 
 
 def predict_next_value(history: list[int]) -> int:
@@ -41,5 +64,7 @@ def predict_previous_value(history: list[int]) -> int:
 
 
 if __name__ == "__main__":
-    part_one("../input.txt")
-    part_two("../input.txt")
+    from sys import argv
+
+    path = argv[1] if len(argv) > 1 else "../input.txt"
+    print_answers(stream_input(path), compute_part_one, compute_part_two)
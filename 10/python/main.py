@@ -1,11 +1,35 @@
+import sys
+from pathlib import Path
 from collections import defaultdict
-from colorama import init
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.grid import Grid
+from aoc.profiling import phase
+
+
+Position = tuple[int, int]
 
 
 def part_one(path):
-    with open(path, "r") as f:
-        lines = [line.strip() for line in f]
-    graph, start_pos, _, _ = read_graph(lines=lines)
+    print(compute_part_one(read_input(path)))
+
+
+def part_two(path):
+    grid = read_input(path)
+    pipe_set, enclosed_area = find_pipe_and_enclosed_area(grid)
+    visualize(grid=grid, pipe_set=pipe_set, enclosed_area=enclosed_area)
+    print("Enclosed area: ", len(enclosed_area))
+
+
+def read_input(path) -> Grid:
+    return Grid.read(path)
+
+
+def compute_part_one(grid: Grid) -> int:
+    graph, start_pos, _, _ = read_graph(grid=grid)
 
     distances_from_start = {start_pos: 0}
     stack = [start_pos]
@@ -19,13 +43,16 @@ def part_one(path):
                 distances_from_start[neighboring_pos] = distance + 1
                 stack.append(neighboring_pos)
 
-    print(max(distances_from_start.values()))
+    return max(distances_from_start.values())
 
 
-def part_two(path):
-    with open(path, "r") as f:
-        lines = [line.strip() for line in f]
-    graph, start_pos, nb_rows, nb_cols = read_graph(lines=lines)
+def compute_part_two(grid: Grid) -> int:
+    _, enclosed_area = find_pipe_and_enclosed_area(grid)
+    return len(enclosed_area)
+
+
+def find_pipe_and_enclosed_area(grid: Grid) -> tuple[set[Position], set[Position]]:
+    graph, start_pos, nb_rows, nb_cols = read_graph(grid=grid)
 
     # Extract the pipe (cycle detection via DFS)
     pipe_set = {start_pos}
@@ -53,27 +80,28 @@ def part_two(path):
 
     # Compute enclosed area, diagonal ray from each point, if crosses the the enclosure an odd number of times, it is outside
     enclosed_area = set()
-    enclosed_count = 0
-    for i, line in enumerate(lines):
-        for j, _ in enumerate(line):
+    for i in range(nb_rows):
+        for j in range(nb_cols):
             if (i, j) in pipe_set:
                 continue
 
             # The edges L and 7 are not crossed by the ray
             diagonal_ray = [
-                lines[i2][j2]
+                grid[i2, j2]
                 for (i2, j2) in zip(range(i, nb_rows), range(j, nb_cols))
-                if (i2, j2) in pipe_set and lines[i2][j2] not in "L7"
+                if (i2, j2) in pipe_set and grid[i2, j2] not in b"L7"
             ]
 
             if len(diagonal_ray) % 2 == 1:
-                enclosed_count += 1
                 enclosed_area.add((i, j))
 
-    # Visualize the result
-    for (i, line) in enumerate(lines):
+    return pipe_set, enclosed_area
+
+
+def visualize(grid: Grid, pipe_set: set[Position], enclosed_area: set[Position]):
+    for (i, line) in enumerate(grid.rows()):
         colored_chars = []
-        for (j, char) in enumerate(line):
+        for (j, char) in enumerate(line.tobytes().decode()):
             if (i, j) in pipe_set:
                 colored_chars.append("\033[33m" + char + "\033[39m")
             elif (i, j) in enclosed_area:
@@ -82,47 +110,45 @@ def part_two(path):
                 colored_chars.append("\033[34m" + char + "\033[39m")
         print("".join(colored_chars))
 
-    print("Enclosed area: ", enclosed_count)
-
 
-def read_graph(lines):
-    nb_rows = len(lines)
-    nb_cols = len(lines[0])
+@phase("build")
+def read_graph(grid: Grid):
+    nb_rows, nb_cols = grid.shape
 
     graph = defaultdict(list)
     start_pos = None
     dots = []
-    for (i, line) in enumerate(lines):
-        for (j, char) in enumerate(line):
+    for (i, line) in enumerate(grid.rows()):
+        for (j, char) in enumerate(line.tobytes().decode()):
             match char:
                 case "|":
-                    handle_north(i=i, j=j, lines=lines, graph=graph)
-                    handle_south(i=i, j=j, lines=lines, graph=graph)
+                    handle_north(i=i, j=j, grid=grid, graph=graph)
+                    handle_south(i=i, j=j, grid=grid, graph=graph)
 
                 case "-":
                     handle_east(i=i, j=j, line=line, graph=graph)
                     handle_west(i=i, j=j, line=line, graph=graph)
 
                 case "L":
-                    handle_north(i=i, j=j, lines=lines, graph=graph)
+                    handle_north(i=i, j=j, grid=grid, graph=graph)
                     handle_east(i=i, j=j, line=line, graph=graph)
 
                 case "J":
-                    handle_north(i=i, j=j, lines=lines, graph=graph)
+                    handle_north(i=i, j=j, grid=grid, graph=graph)
                     handle_west(i=i, j=j, line=line, graph=graph)
 
                 case "7":
-                    handle_south(i=i, j=j, lines=lines, graph=graph)
+                    handle_south(i=i, j=j, grid=grid, graph=graph)
                     handle_west(i=i, j=j, line=line, graph=graph)
 
                 case "F":
                     handle_east(i=i, j=j, line=line, graph=graph)
-                    handle_south(i=i, j=j, lines=lines, graph=graph)
+                    handle_south(i=i, j=j, grid=grid, graph=graph)
 
                 case "S":
                     start_pos = (i, j)
-                    handle_north(i=i, j=j, lines=lines, graph=graph)
-                    handle_south(i=i, j=j, lines=lines, graph=graph)
+                    handle_north(i=i, j=j, grid=grid, graph=graph)
+                    handle_south(i=i, j=j, grid=grid, graph=graph)
                     handle_east(i=i, j=j, line=line, graph=graph)
                     handle_west(i=i, j=j, line=line, graph=graph)
 
@@ -133,10 +159,10 @@ def read_graph(lines):
     return graph, start_pos, nb_rows, nb_cols
 
 
-def handle_north(i, j, lines, graph):
+def handle_north(i, j, grid, graph):
     if i >= 1:
-        upper_char = lines[i - 1][j]
-        if upper_char in "|7FS":
+        upper_char = grid[i - 1, j]
+        if upper_char in b"|7FS":
             graph[(i, j)].append((i - 1, j))
 
 
@@ -146,28 +172,27 @@ def handle_east(i, j, line, graph):
     except IndexError:
         pass
     else:
-        if right_char in "-7JS":
+        if right_char in b"-7JS":
             graph[(i, j)].append((i, j + 1))
 
 
-def handle_south(i, j, lines, graph):
-    try:
-        south_char = lines[i + 1][j]
-    except IndexError:
-        pass
-    else:
-        if south_char in "SL|J":
+def handle_south(i, j, grid, graph):
+    if i + 1 < grid.nb_rows:
+        south_char = grid[i + 1, j]
+        if south_char in b"SL|J":
             graph[(i, j)].append((i + 1, j))
 
 
 def handle_west(i, j, line, graph):
     if j >= 1:
         west_char = line[j - 1]
-        if west_char in "S-FL":
+        if west_char in b"S-FL":
             graph[(i, j)].append((i, j - 1))
 
 
 if __name__ == "__main__":
+    from colorama import init
+
     init()
     part_one("../input.txt")
     part_two("../input.txt")
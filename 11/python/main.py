@@ -1,29 +1,48 @@
+import sys
+from pathlib import Path
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.grid import Grid
+from aoc.profiling import phase
+
+
 def part_one(path):
-    solve(path=path, expansion_factor=2)
+    print(compute_part_one(read_input(path)))
 
 
 def part_two(path):
-    solve(path=path, expansion_factor=1_000_000)
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> Grid:
+    return Grid.read(path)
+
+
+def compute_part_one(grid: Grid) -> int:
+    return solve(grid=grid, expansion_factor=2)
+
+
+def compute_part_two(grid: Grid) -> int:
+    return solve(grid=grid, expansion_factor=1_000_000)
 
 
-def solve(path, expansion_factor):
+def solve(grid: Grid, expansion_factor: int) -> int:
     mult_factor = expansion_factor - 1
-    with open(path, "r") as f:
-        lines = [line.strip() for line in f]
-    nb_rows = len(lines)
-    nb_cols = len(lines[0])
+    nb_rows, nb_cols = grid.shape
     empty_cols = set(range(nb_cols))
     empty_rows = set(range(nb_rows))
     galaxies = set()
 
-    for (i, line) in enumerate(lines):
-        for (j, char) in enumerate(line):
-            if char == "#":
-                galaxies.add((i, j))
-                if i in empty_rows:
-                    empty_rows.remove(i)
-                if j in empty_cols:
-                    empty_cols.remove(j)
+    with phase("build"):
+        for (i, j) in grid.find_all(ord("#")):
+            galaxies.add((i, j))
+            if i in empty_rows:
+                empty_rows.remove(i)
+            if j in empty_cols:
+                empty_cols.remove(j)
 
     distances = {}
     for (i1, j1) in galaxies:
@@ -41,7 +60,7 @@ def solve(path, expansion_factor):
                     len(empty_rows_between) + len(empty_cols_between)
                 )
                 distances[pair] = adjusted_distance
-    print(sum(distances.values()))
+    return sum(distances.values())
 
 
 if __name__ == "__main__":
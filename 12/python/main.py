@@ -1,27 +1,50 @@
+import sys
+from pathlib import Path
 from itertools import chain
+from typing import Iterable, Iterator
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.streams import print_answers, read_lines
+
 
 def part_one(path):
-    with open(path, "r") as f:
-        sum_nb_arrangements = 0
-        for line in f:
-            record, groups_str = line.strip().split()
-            groups = [int(group_str) for group_str in groups_str.split(",")]
-            nb_arrangements = compute_arrangements(record=record, groups=groups)
-            sum_nb_arrangements += nb_arrangements
-        print(sum_nb_arrangements)
+    print(compute_part_one(read_input(path)))
 
 
 def part_two(path):
-    with open(path, "r") as f:
-        sum_nb_arrangements = 0
-        for line in f:
-            record, groups_str = line.strip().split()
-            groups = [int(group_str) for group_str in groups_str.split(",")]
-            groups = groups * 5
-            record = "?".join([record] * 5)
-            nb_arrangements = compute_arrangements(record=record, groups=groups)
-            sum_nb_arrangements += nb_arrangements
-        print(sum_nb_arrangements)
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> list[tuple[str, list[int]]]:
+    return list(stream_input(path))
+
+
+def stream_input(path) -> Iterator[tuple[str, list[int]]]:
+    for line in read_lines(path):
+        record, groups_str = line.strip().split()
+        groups = [int(group_str) for group_str in groups_str.split(",")]
+        yield record, groups
+
+
+def compute_part_one(rows: Iterable[tuple[str, list[int]]]) -> int:
+    sum_nb_arrangements = 0
+    for record, groups in rows:
+        nb_arrangements = compute_arrangements(record=record, groups=groups)
+        sum_nb_arrangements += nb_arrangements
+    return sum_nb_arrangements
+
+
+def compute_part_two(rows: Iterable[tuple[str, list[int]]]) -> int:
+    sum_nb_arrangements = 0
+    for record, groups in rows:
+        groups = groups * 5
+        record = "?".join([record] * 5)
+        nb_arrangements = compute_arrangements(record=record, groups=groups)
+        sum_nb_arrangements += nb_arrangements
+    return sum_nb_arrangements
 
 
 def compute_arrangements(record: str, groups: list[int]) -> int:
@@ -46,7 +69,6 @@ def compute_arrangements(record: str, groups: list[int]) -> int:
                     dyn_matrix[i][j] = dyn_matrix[i - 1][j_prev] + dyn_matrix[i][j + 1]
                 case "?":
                     dyn_matrix[i][j] = dyn_matrix[i][j + 1]
-    print(dyn_matrix)
     return dyn_matrix[-1][0]
 
 
@@ -60,5 +82,7 @@ def matches(group: int, record: str):
 
 
 if __name__ == "__main__":
-    part_one("../input.txt")
-    part_two("../input.txt")
+    from sys import argv
+
+    path = argv[1] if len(argv) > 1 else "../input.txt"
+    print_answers(stream_input(path), compute_part_one, compute_part_two)
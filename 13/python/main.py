@@ -1,25 +1,47 @@
+import sys
+from pathlib import Path
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.grid import Grid
+from aoc.reader import blocks
+
+
 def part_one(path):
-    solve(path, smudge=False)
+    print(compute_part_one(read_input(path)))
 
 
 def part_two(path):
-    solve(path, smudge=True)
+    print(compute_part_two(read_input(path)))
 
 
-def solve(path, smudge):
-    summary = 0
-    with open(path, "r") as f:
-        file_content = f.read().strip()
+def read_input(path) -> list[Grid]:
+    return [
+        Grid.from_buffer(bytearray(pattern_bytes)) for pattern_bytes in blocks(path)
+    ]
+
+
+def compute_part_one(patterns: list[Grid]) -> int:
+    return solve(patterns, smudge=False)
 
-    for pattern_str in file_content.split("\n\n"):
-        pattern_lines = pattern_str.split("\n")
+
+def compute_part_two(patterns: list[Grid]) -> int:
+    return solve(patterns, smudge=True)
+
+
+def solve(patterns: list[Grid], smudge: bool) -> int:
+    summary = 0
+    for pattern in patterns:
+        pattern_lines = list(pattern.rows())
         column = (
             reflection_column_smudge(pattern_lines=pattern_lines)
             if smudge
             else reflection_column(pattern_lines=pattern_lines)
         )
         if not column:
-            pattern_cols = transpose(pattern_lines)
+            pattern_cols = list(pattern.columns())
             row = (
                 reflection_column_smudge(pattern_lines=pattern_cols)
                 if smudge
@@ -29,10 +51,10 @@ def solve(path, smudge):
         else:
             row = 0
         summary += column + 100 * row
-    print(summary)
+    return summary
 
 
-def reflection_column(pattern_lines: list[str]) -> int:
+def reflection_column(pattern_lines: list[memoryview]) -> int:
     nb_cols = len(pattern_lines[0])
     for j in range(1, nb_cols):
         for line in pattern_lines:
@@ -46,7 +68,7 @@ def reflection_column(pattern_lines: list[str]) -> int:
     return 0
 
 
-def reflection_column_smudge(pattern_lines: list[str]) -> int:
+def reflection_column_smudge(pattern_lines: list[memoryview]) -> int:
     nb_cols = len(pattern_lines[0])
     for j in range(1, nb_cols):
         nb_smudges = 0
@@ -68,14 +90,5 @@ def reflection_column_smudge(pattern_lines: list[str]) -> int:
     return 0
 
 
-def transpose(pattern_lines: list[str]) -> list[str]:
-    nb_cols = len(pattern_lines[0])
-    transposed_lines = [[] for _ in range(nb_cols)]
-    for line in pattern_lines:
-        for (j, char) in enumerate(line):
-            transposed_lines[j].append(char)
-    return ["".join(line) for line in transposed_lines]
-
-
 if __name__ == "__main__":
     part_two("../input.txt")
@@ -1,10 +1,13 @@
+import sys
+from pathlib import Path
 from collections import OrderedDict
+from typing import Iterable
 
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-def part_one(path):
-    steps = read_steps(path=path)
-    res = sum(hashmap(step) for step in steps)
-    print(res)
+from aoc.reader import tokens
 
 
 Step = str
@@ -13,8 +16,24 @@ FocalLength = int
 Box = OrderedDict[Label, FocalLength]
 
 
+def part_one(path):
+    print(compute_part_one(read_input(path)))
+
+
 def part_two(path):
-    steps = read_steps(path=path)
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> list[Step]:
+    return list(read_steps(path=path))
+
+
+def compute_part_one(steps: Iterable[Step]) -> int:
+    res = sum(hashmap(step) for step in steps)
+    return res
+
+
+def compute_part_two(steps: Iterable[Step]) -> int:
     boxes: list[Box] = [OrderedDict() for _ in range(256)]
 
     for step in steps:
@@ -30,16 +49,15 @@ def part_two(path):
             box = boxes[i_box]
             box[label] = focal_length
 
+    res = 0
     for (i_box, box) in enumerate(boxes, 1):
         for (i_label, (label, length)) in enumerate(box.items(), 1):
             res += i_label * i_box * length
-    print(res)
+    return res
 
 
 def read_steps(path):
-    with open(path, "r") as f:
-        init_sequence = f.read().strip()
-    return init_sequence.split(",")
+    return (step.decode() for step in tokens(path, b","))
 
 
 def hashmap(step: str) -> int:
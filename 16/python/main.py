@@ -1,15 +1,23 @@
-from enum import Enum
+import sys
+from pathlib import Path
+from enum import Enum, IntEnum
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.grid import Grid
 
 
-class Tile(Enum):
-    empty = "."
-    vertical_splitter = "|"
-    horizontal_splitter = "-"
-    mirror = "/"
-    back_mirror = "\\"
+class Tile(IntEnum):
+    empty = ord(".")
+    vertical_splitter = ord("|")
+    horizontal_splitter = ord("-")
+    mirror = ord("/")
+    back_mirror = ord("\\")
 
 
-Contraption = list[list[Tile]]
+Contraption = Grid
 Position = tuple[int, int]
 Segment = tuple[Position, Position]
 
@@ -27,33 +35,40 @@ Trajectory = list[Position]
 
 
 def part_one(path):
-    contraption = read_contraption(path)
+    print(compute_part_one(read_input(path)))
+
+
+def part_two(path):
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> Contraption:
+    return read_contraption(path)
+
+
+def compute_part_one(contraption: Contraption) -> int:
     nb_energized_positions = compute_nb_energized_positions(
         contraption=contraption, initial_photon=((0, 0), Direction.right)
     )
-    print(nb_energized_positions)
+    return nb_energized_positions
 
 
-def part_two(path):
-    contraption = read_contraption(path)
-    nb_rows, nb_cols = len(contraption), len(contraption[0])
+def compute_part_two(contraption: Contraption) -> int:
+    nb_rows, nb_cols = contraption.shape
     initial_photons: list[Photon] = [((x, 0), Direction.down) for x in range(nb_cols)]
     initial_photons.extend([((0, y), Direction.right) for y in range(nb_rows)])
 
     initial_photons.extend([((x, nb_rows - 1), Direction.up) for x in range(nb_cols)])
     initial_photons.extend([((nb_cols - 1, y), Direction.left) for y in range(nb_rows)])
 
-    print(
-        max(
-            compute_nb_energized_positions(contraption, photon)
-            for photon in initial_photons
-        )
+    return max(
+        compute_nb_energized_positions(contraption, photon)
+        for photon in initial_photons
     )
 
 
 def compute_nb_energized_positions(contraption: Contraption, initial_photon: Photon):
-    nb_rows = len(contraption)
-    nb_cols = len(contraption[0])
+    nb_rows, nb_cols = contraption.shape
     photons: list[Photon] = [initial_photon]
     energized_positions: set[Position] = set()
     added_segments: set[Segment] = set()
@@ -67,7 +82,7 @@ def compute_nb_energized_positions(contraption: Contraption, initial_photon: Pho
         segment = (trajectory[0], trajectory[-1])
         if segment not in added_segments:
             x_final, y_final = trajectory[-1]
-            tile_at_final_position = contraption[y_final][x_final]
+            tile_at_final_position = contraption[y_final, x_final]
             new_photons = next_photons(
                 direction, (x_final, y_final), tile_at_final_position
             )
@@ -80,16 +95,12 @@ def compute_nb_energized_positions(contraption: Contraption, initial_photon: Pho
 
 
 def read_contraption(path) -> Contraption:
-    contraption: Contraption = []
-    with open(path, "r") as f:
-        for line in f:
-            contraption.append([Tile(char) for char in line.strip()])
-    return contraption
+    return Grid.read(path)
 
 
 def move_photon(contraption: Contraption, photon: Photon) -> Trajectory:
     ((ix, iy), direction) = photon
-    nb_rows, nb_cols = len(contraption), len(contraption[0])
+    nb_rows, nb_cols = contraption.shape
     max_x = nb_cols - 1
     max_y = nb_rows - 1
     match direction:
@@ -110,7 +121,7 @@ def move_photon(contraption: Contraption, photon: Photon) -> Trajectory:
     trajectory: Trajectory = []
     for x, y in gen_trajectory((ix, iy), final_position, direction):
         trajectory.append((x, y))
-        if contraption[y][x] in blocking_tiles:
+        if contraption[y, x] in blocking_tiles:
             break
     return trajectory
 
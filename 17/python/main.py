@@ -1,7 +1,17 @@
+import sys
+from pathlib import Path
 from dataclasses import dataclass
 from heapq import heappush, heappop
 from enum import Enum
 
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.grid import Grid
+
+HEAT_LOSSES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
 
 class Direction(Enum):
     UP = "up"
@@ -83,21 +93,21 @@ class Position:
 
 @dataclass()
 class Blocks:
-    data: list[list[int]]
+    data: Grid
 
     def heat_loss(self, position: Position):
-        return self.data[position.y][position.x]
+        return self.data[position.y, position.x]
 
     def __contains__(self, position: Position):
         return 0 <= position.y < self.nb_rows and 0 <= position.x < self.nb_cols
 
     @property
     def nb_cols(self):
-        return len(self.data[0])
+        return self.data.nb_cols
 
     @property
     def nb_rows(self):
-        return len(self.data)
+        return self.data.nb_rows
 
 
 @dataclass(frozen=True)
@@ -110,16 +120,27 @@ class Crucible:
 
 
 def part_one(path):
-    solve(path, min_consecutive=0, max_consecutive=3)
+    print(compute_part_one(read_input(path)))
 
 
 def part_two(path):
-    solve(path, min_consecutive=4, max_consecutive=10)
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> Blocks:
+    return read_blocks(path=path)
+
+
+def compute_part_one(blocks: Blocks) -> int:
+    return solve(blocks, min_consecutive=0, max_consecutive=3)
+
+
+def compute_part_two(blocks: Blocks) -> int:
+    return solve(blocks, min_consecutive=4, max_consecutive=10)
 
 
-def solve(path, min_consecutive: int, max_consecutive: int):
-    blocks = read_blocks(path=path)
-    i, heat_losses = compute_heat_losses(
+def solve(blocks: Blocks, min_consecutive: int, max_consecutive: int) -> int:
+    _, heat_losses = compute_heat_losses(
         blocks, min_consecutive=min_consecutive, max_consecutive=max_consecutive
     )
     last_position = Position(x=blocks.nb_cols - 1, y=blocks.nb_rows - 1)
@@ -128,14 +149,11 @@ def solve(path, min_consecutive: int, max_consecutive: int):
         for (crucible, heat_loss) in heat_losses.items()
         if crucible.position == last_position
     )
-    print("min heat loss:", min_heat_loss)
-    print(i, "iterations")
+    return min_heat_loss
 
 
 def read_blocks(path):
-    with open(path, "r") as f:
-        blocks_data = [[int(char) for char in line.strip()] for line in f]
-    blocks = Blocks(blocks_data)
+    blocks = Blocks(Grid.read(path).translated(HEAT_LOSSES))
     return blocks
 
 
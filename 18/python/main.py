@@ -1,52 +1,81 @@
+import sys
+from pathlib import Path
 from sys import argv
-from itertools import pairwise
-from typing import Callable
+from typing import Callable, Iterable, Iterator
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.streams import print_answers, read_lines
 
 
 Point = tuple[int, int]
 
 
 def part_one(path):
-    solve(path=path, parse_line=parse_direction_length_part1)
+    print(compute_part_one(read_input(path)))
 
 
 def part_two(path):
-    solve(path=path, parse_line=parse_direction_length_part2)
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> list[str]:
+    return list(stream_input(path))
+
+
+def stream_input(path) -> Iterator[str]:
+    return read_lines(path)
+
+
+def compute_part_one(lines: Iterable[str]) -> int:
+    return solve(lines=lines, parse_line=parse_direction_length_part1)
+
+
+def compute_part_two(lines: Iterable[str]) -> int:
+    return solve(lines=lines, parse_line=parse_direction_length_part2)
 
 
-def solve(path, parse_line):
-    points, length = read_outline_length(path, parse_line)
-    area = shoelace(points)
-    print(int(area - 0.5 * length + 1) + length)
+def solve(lines, parse_line) -> int:
+    area, length = read_area_length(lines, parse_line)
+    return int(area - 0.5 * length + 1) + length
 
 
-def read_outline_length(path, parse_direction_length: Callable[[str], tuple[str, int]]):
-    with open(path, "r") as f:
-        x, y = 0, 0
-        length = 0
-        outline: list[Point] = [(x, y)]
-        for line in f:
-            direction, nb = parse_direction_length(line)
-            length += nb
-            match direction:
-                case "R":
-                    x += nb
-                case "L":
-                    x -= nb
-                case "D":
-                    y += nb
-                case "U":
-                    y -= nb
+def read_area_length(
+    lines: Iterable[str], parse_direction_length: Callable[[str], tuple[str, int]]
+) -> tuple[float, int]:
+    """
+    Area enclosed by the outline and its length, the shoelace sum being
+    accumulated as the lines are read instead of storing the outline.
+    """
+    x, y = 0, 0
+    length = 0
+    double_area = 0
+    for line in lines:
+        direction, nb = parse_direction_length(line)
+        length += nb
+        x_next, y_next = x, y
+        match direction:
+            case "R":
+                x_next += nb
+            case "L":
+                x_next -= nb
+            case "D":
+                y_next += nb
+            case "U":
+                y_next -= nb
 
-                case _:
-                    raise ValueError()
-            outline.append((x, y))
-        return outline, length
+            case _:
+                raise ValueError()
+        double_area += shoelace_term((x, y), (x_next, y_next))
+        x, y = x_next, y_next
+    return double_area / 2, length
 
 
-def shoelace(x_y):
-    area = sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in pairwise(x_y)) / 2
-    return area
+def shoelace_term(point1: Point, point2: Point) -> int:
+    (x1, y1), (x2, y2) = point1, point2
+    return x1 * y2 - x2 * y1
 
 
 def parse_direction_length_part1(line: str):
@@ -73,6 +102,5 @@ def parse_direction_length_part2(line: str):
 
 
 if __name__ == "__main__":
-    path = argv[1]
-    part_one(path=path)
-    part_two(path=path)
+    path = argv[1] if len(argv) > 1 else "../input.txt"
+    print_answers(stream_input(path), compute_part_one, compute_part_two)
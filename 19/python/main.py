@@ -1,10 +1,18 @@
+import sys
+from pathlib import Path
 from sys import argv
 from dataclasses import dataclass
 from operator import lt, gt
 from typing import Any
 from math import prod
 from collections import deque
-import portion as P
+
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.intervals import IntervalSet
+from aoc.reader import blocks
 
 MAX_VALUE = 5000
 MIN_VALUE = -1
@@ -35,14 +43,14 @@ class Condition:
         return self.operator(left_value, self.right_value)
 
     def split(self, rating_range: "RatingRange") -> tuple["RatingRange", "RatingRange"]:
-        interval: P.Interval = getattr(rating_range, self.left_attribute)
+        interval: IntervalSet = getattr(rating_range, self.left_attribute)
         match self.operator:
             case _ if self.operator is lt:
-                interval1 = interval & P.closed(MIN_VALUE, self.right_value - 1)
-                interval2 = interval & P.closed(self.right_value, MAX_VALUE)
+                interval1 = interval & IntervalSet.closed(MIN_VALUE, self.right_value - 1)
+                interval2 = interval & IntervalSet.closed(self.right_value, MAX_VALUE)
             case _ if self.operator is gt:
-                interval1 = interval & P.closed(self.right_value + 1, MAX_VALUE)
-                interval2 = interval & P.closed(MIN_VALUE, self.right_value)
+                interval1 = interval & IntervalSet.closed(self.right_value + 1, MAX_VALUE)
+                interval2 = interval & IntervalSet.closed(MIN_VALUE, self.right_value)
             case _:
                 raise ValueError(self.operator)
         kwargs = {
@@ -65,45 +73,56 @@ class Rule:
 
 @dataclass(frozen=True)
 class RatingRange:
-    x: P.Interval
-    m: P.Interval
-    a: P.Interval
-    s: P.Interval
+    x: IntervalSet
+    m: IntervalSet
+    a: IntervalSet
+    s: IntervalSet
 
     def __len__(self):
-        return prod(self._interval_length(i) for i in (self.x, self.m, self.a, self.s))
+        return prod(len(i) for i in (self.x, self.m, self.a, self.s))
 
     @classmethod
     def empty(cls):
-        return RatingRange(x=P.empty(), m=P.empty(), a=P.empty(), s=P.empty())
-
-    @classmethod
-    def _interval_length(cls, interval: P.Interval):
-        if interval.atomic:
-            return interval.upper - interval.lower + 1
-        return sum(cls._interval_length(sub_interval) for sub_interval in interval)
+        return RatingRange(
+            x=IntervalSet(), m=IntervalSet(), a=IntervalSet(), s=IntervalSet()
+        )
 
 
 Worflow = deque[Rule | str]
 
 
+Workflows = dict[str, Worflow]
+
+
 def part_one(path):
-    workflows, ratings = read_workflows_ratings(path)
+    print(compute_part_one(read_input(path)))
+
+
+def part_two(path):
+    print(compute_part_two(read_input(path)))
+
+
+def read_input(path) -> tuple[Workflows, list[Rating]]:
+    return read_workflows_ratings(path)
+
+
+def compute_part_one(workflows_ratings: tuple[Workflows, list[Rating]]) -> int:
+    workflows, ratings = workflows_ratings
     sum_accepted_ratings = sum(
         sum(rating)
         for rating in ratings
         if accepted(workflows=workflows, destination="in", rating=rating)
     )
-    print(sum_accepted_ratings)
+    return sum_accepted_ratings
 
 
-def part_two(path):
-    workflows, _ = read_workflows_ratings(path)
+def compute_part_two(workflows_ratings: tuple[Workflows, list[Rating]]) -> int:
+    workflows, _ = workflows_ratings
     rating_range = RatingRange(
-        x=P.closed(1, 4000),
-        m=P.closed(1, 4000),
-        a=P.closed(1, 4000),
-        s=P.closed(1, 4000),
+        x=IntervalSet.closed(1, 4000),
+        m=IntervalSet.closed(1, 4000),
+        a=IntervalSet.closed(1, 4000),
+        s=IntervalSet.closed(1, 4000),
     )
     ratings_worflows: deque[tuple[RatingRange, Worflow]] = deque(
         [(rating_range, deque(["in"]))]
@@ -113,14 +132,13 @@ def part_two(path):
         accepted_range = scatter(ratings_worflows=ratings_worflows, workflows=workflows)
         if accepted_range != RatingRange.empty():
             accepted_ratings.append(accepted_range)
-    print(sum(len(r) for r in accepted_ratings))
+    return sum(len(r) for r in accepted_ratings)
 
 
 def read_workflows_ratings(path):
-    with open(path, "r") as f:
-        worflows_str, ratings_str = f.read().split("\n\n")
-    workflows = parse_workflows(worflows_str)
-    ratings = parse_ratings(ratings_str)
+    worflows_bytes, ratings_bytes = blocks(path)
+    workflows = parse_workflows(worflows_bytes.decode())
+    ratings = parse_ratings(ratings_bytes.decode())
     return workflows, ratings
 
 
@@ -164,7 +182,7 @@ def scatter(
         case "R":
             return empty
         case str(dest):
-            ratings_worflows.appendleft((rating_range, workflows[dest]))
+            ratings_worflows.appendleft((rating_range, deque(workflows[dest])))
             return empty
         case Rule(condition=condition, destination=destination):
             rating_range1, rating_range2 = condition.split(rating_range)
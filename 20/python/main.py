@@ -1,12 +1,20 @@
+import sys
+from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 from abc import ABC, abstractmethod
 from collections import defaultdict, deque
-from pprint import PrettyPrinter
 from math import lcm
-from graphviz import Digraph
+from typing import TYPE_CHECKING
 
-printer = PrettyPrinter(indent=3)
+if __name__ == "__main__":
+    # Run as a script from its folder: the repository root holds the aoc package
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from aoc.profiling import phase
+
+if TYPE_CHECKING:
+    from graphviz import Digraph
 
 
 class Signal(Enum):
@@ -77,12 +85,37 @@ class Conjunction(Pulsable):
         self.origins[origin] = Signal.low
 
 
+Predessors = dict[str, set[str]]
+Successors = dict[str, list[str]]
+ModuleTypes = dict[str, type[Pulsable]]
+Modules = dict[str, Pulsable]
+
+
 def part_one(path):
-    predecessors, successors, module_types = read_graph(path)
+    print(compute_part_one(read_input(path)))
+
+
+def part_two(input_path, output_path=None):
+    predecessors, successors, module_types = read_input(input_path)
+    if output_path is not None:
+        nodes = set(predecessors.keys()).union(set(successors.keys()))
+        graph = build_graph(
+            module_types=module_types, nodes=nodes, successors=successors
+        )
+        write_dot_file(output_path, digraph=graph)
+    print(compute_part_two((predecessors, successors, module_types)))
+
+
+def read_input(path) -> tuple[Predessors, Successors, ModuleTypes]:
+    return read_graph(path)
+
+
+def compute_part_one(graph: tuple[Predessors, Successors, ModuleTypes]) -> int:
+    predecessors, successors, module_types = graph
     modules = build_modules(
         predecessors=predecessors, successors=successors, module_types=module_types
     )
-    # printer.pprint(modules)
+    # pprint(modules, indent=3)
     nb_lows = 0
     nb_highs = 0
     for _ in range(1000):
@@ -103,14 +136,11 @@ def part_one(path):
                 origin=origin_name, signal=signal
             ):
                 signals.append((destination_name, s, new_destination))
-    print(nb_lows * nb_highs)
+    return nb_lows * nb_highs
 
 
-def part_two(input_path, output_path):
-    predecessors, successors, module_types = read_graph(input_path)
-    nodes = set(predecessors.keys()).union(set(successors.keys()))
-    graph = build_graph(module_types=module_types, nodes=nodes, successors=successors)
-    write_dot_file(output_path, digraph=graph)
+def compute_part_two(graph: tuple[Predessors, Successors, ModuleTypes]) -> int:
+    predecessors, successors, module_types = graph
     modules = build_modules(
         predecessors=predecessors, successors=successors, module_types=module_types
     )
@@ -123,13 +153,7 @@ def part_two(input_path, output_path):
         subgraph_until_output(modules=modules, predecessors=predecessors, module=module)
         for module in grandparents_of_output_module
     ]
-    print(lcm(*periods))
-
-
-Predessors = dict[str, set[str]]
-Successors = dict[str, list[str]]
-ModuleTypes = dict[str, type[Pulsable]]
-Modules = dict[str, Pulsable]
+    return lcm(*periods)
 
 
 def read_graph(path):
@@ -158,11 +182,12 @@ def read_graph(path):
     return predecessors, successors, module_types
 
 
-def write_dot_file(path, digraph: Digraph):
+def write_dot_file(path, digraph: "Digraph"):
     with open(path, "w") as f:
         f.write(digraph.source)
 
 
+@phase("build")
 def build_modules(
     predecessors: dict[str, set[str]], successors: dict[str, list[str]], module_types
 ):
@@ -223,6 +248,8 @@ def parents(module: str, predecessors: Predessors):
 
 
 def build_graph(module_types: ModuleTypes, nodes: set[str], successors: Successors):
+    from graphviz import Digraph
+
     dot = Digraph()
     for node in nodes:
         match module_types.get(node):
@@ -0,0 +1,7 @@
+"""
+Shared tooling around the per-day solutions living in ``NN/python/main.py``.
+
+Run it from the repository root, e.g. ``python -m aoc run 3 5-7``.
+The days still run as scripts from their own folder, ``python main.py``: when
+launched that way they put the repository root on ``sys.path`` themselves.
+"""
@@ -0,0 +1,22 @@
+import argparse
+import sys
+
+from aoc import batch, cache, client, daemon, differential, generators, runner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="aoc")
+    subparsers = parser.add_subparsers(required=True)
+    runner.configure_parser(subparsers)
+    generators.configure_parser(subparsers)
+    batch.configure_parser(subparsers)
+    cache.configure_parser(subparsers)
+    daemon.configure_parser(subparsers)
+    client.configure_parser(subparsers)
+    differential.configure_parser(subparsers)
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Solve one day over many inputs, spread over a pool of worker processes that
+each import the day and set up their ``Cache`` once.
+"""
+
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from functools import partial
+
+from aoc.cache import Cache, add_cache_arguments
+from aoc.days import PARTS, load_day
+from aoc.runner import PartResult, run_part
+
+
+def expand_inputs(patterns: list[str]) -> list[str]:
+    """
+    Paths and glob patterns, in the given order, each pattern sorted.
+    """
+    paths: list[str] = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            paths.append(pattern)
+    return paths
+
+
+# Cache of the worker process, set by init_worker
+_cache: Cache | None = None
+
+
+def init_worker(day: int, cache: Cache | None):
+    global _cache
+    _cache = cache
+    load_day(day)
+
+
+def solve_input(day: int, parts: list[int], path: str) -> list[PartResult]:
+    return [run_part(day, part, path, _cache) for part in parts]
+
+
+def solve_many(
+    day: int,
+    paths: list[str],
+    parts: list[int] | None = None,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    cache: Cache | None = None,
+) -> list[list[PartResult]]:
+    """
+    Results for every path, in input order, one PartResult per part.
+    By default every core gets a worker and about four chunks of inputs.
+    """
+    parts = parts or list(PARTS)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(paths) // (4 * workers))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(day, cache)
+    ) as executor:
+        return list(
+            executor.map(partial(solve_input, day, parts), paths, chunksize=chunksize)
+        )
+
+
+def main(args):
+    paths = expand_inputs(args.inputs)
+    results = solve_many(
+        day=args.day,
+        paths=paths,
+        parts=args.part,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        cache=Cache(directory=args.cache_dir) if args.cache else None,
+    )
+    failed = False
+    for path_results in results:
+        for r in path_results:
+            failed = failed or r.error is not None
+            if args.json:
+                print(json.dumps(asdict(r), default=str))
+            else:
+                answer = f"ERROR {r.error}" if r.error else r.answer
+                print(
+                    f"{r.path}\tpart {r.part}\t{r.total_wall * 1000:.1f} ms\t{answer}"
+                )
+    return 1 if failed else 0
+
+
+def configure_parser(subparsers):
+    parser = subparsers.add_parser(
+        "batch", help="solve a day over many inputs with a process pool"
+    )
+    parser.add_argument("day", type=int)
+    parser.add_argument("inputs", nargs="+", help="input paths or glob patterns")
+    parser.add_argument("-p", "--part", type=int, choices=list(PARTS), action="append")
+    parser.add_argument(
+        "-j", "--workers", type=int, help="worker processes (default: one per core)"
+    )
+    parser.add_argument(
+        "--chunksize", type=int, help="inputs sent to a worker at a time"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    add_cache_arguments(parser)
+    parser.set_defaults(func=main)
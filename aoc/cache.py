@@ -0,0 +1,231 @@
+"""
+Content-addressed cache of parsed inputs and answers.
+
+Entries are keyed by the day, the part (or the parse phase), the solver
+parameters, the solver version and the SHA-256 of the input bytes. They are
+pickled on disk under ``<directory>/<day>/`` with an optional in-memory LRU in
+front. The solver version is a hash of the day's source and of the ``aoc``
+package the days build on, so editing a solver or a shared module makes the old
+entries unreachable; they are then evicted as the least recently
+used once the directory grows past ``max_bytes``.
+
+Values that cannot be pickled, such as generators, are simply not cached.
+Every hit returns a fresh copy, so a solver mutating its parsed input does not
+alter the cached one.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from aoc.days import REFERENCE, engines, load_day
+
+DEFAULT_DIRECTORY = Path(
+    os.environ.get("AOC_CACHE_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "aoc"
+)
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+MISSING = object()
+
+
+def input_digest(path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+@cache
+def package_version() -> str:
+    """
+    Hash of the sources of the ``aoc`` package.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.name.encode() + b"\0" + path.read_bytes())
+    return digest.hexdigest()
+
+
+@cache
+def solver_version(day: int) -> str:
+    """
+    Hash of the day's source file and of the ``aoc`` package it imports from.
+    """
+    source = Path(load_day(day).__file__).read_bytes()
+    return hashlib.sha256(source + package_version().encode()).hexdigest()[:16]
+
+
+def _entry_key(*parts) -> str:
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+@dataclass()
+class Cache:
+    directory: Path = DEFAULT_DIRECTORY
+    max_bytes: int = DEFAULT_MAX_BYTES
+    memory_entries: int = 64
+    _memory: OrderedDict = field(default_factory=OrderedDict, repr=False)
+    _disk_bytes: int | None = field(default=None, repr=False)
+
+    def __post_init__(self):
+        self.directory = Path(self.directory)
+
+    def _path(self, day: int, key: str) -> Path:
+        return self.directory / f"{day:02d}" / f"{key}.pickle"
+
+    def load(self, day: int, key: str) -> Any:
+        """
+        Cached value, or ``MISSING``.
+        """
+        blob = self._memory.get(key)
+        if blob is not None:
+            self._memory.move_to_end(key)
+        else:
+            path = self._path(day, key)
+            try:
+                blob = path.read_bytes()
+                os.utime(path)
+            except FileNotFoundError:
+                return MISSING
+            self._remember(key, blob)
+        return pickle.loads(blob)
+
+    def store(self, day: int, key: str, value: Any):
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        self._remember(key, blob)
+        path = self._path(day, key)
+        size = self.size() - (path.stat().st_size if path.exists() else 0)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside then renamed, so that concurrent readers never see half a file
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+            f.write(blob)
+        os.replace(f.name, path)
+        self._disk_bytes = size + len(blob)
+        if self._disk_bytes > self.max_bytes:
+            self.evict()
+
+    def _remember(self, key: str, blob: bytes):
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = blob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def entries(self) -> list[os.stat_result]:
+        return [path.stat() for path in self.directory.glob("[0-9][0-9]/*.pickle")]
+
+    def size(self) -> int:
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(stat.st_size for stat in self.entries())
+        return self._disk_bytes
+
+    def evict(self, max_bytes: int | None = None):
+        """
+        Delete the least recently used entries until the cache fits ``max_bytes``.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        stats = sorted(
+            (
+                (path, path.stat())
+                for path in self.directory.glob("[0-9][0-9]/*.pickle")
+            ),
+            key=lambda item: item[1].st_mtime,
+        )
+        total = sum(stat.st_size for _, stat in stats)
+        for path, stat in stats:
+            if total <= max_bytes:
+                break
+            total -= stat.st_size
+            path.unlink(missing_ok=True)
+            self._memory.pop(path.stem, None)
+        self._disk_bytes = total
+
+    def invalidate(self, day: int | None = None):
+        """
+        Drop the entries of one day, or of every day.
+        """
+        if day is None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+        else:
+            shutil.rmtree(self.directory / f"{day:02d}", ignore_errors=True)
+        self._memory.clear()
+        self._disk_bytes = None
+
+    def parse(
+        self, day: int, path, digest: str | None = None, engine: str = REFERENCE
+    ) -> Any:
+        """
+        The engine's ``read_input(path)``, cached.
+        """
+        digest = digest or input_digest(path)
+        key = _entry_key(day, "parse", engine, solver_version(day), digest)
+        data = self.load(day, key)
+        if data is MISSING:
+            data = engines(day)[engine].read_input(path)
+            # Pickled here, before the solver gets to consume or mutate it
+            self.store(day, key, data)
+        return data
+
+    def solve(
+        self, day: int, part: int, path, engine: str = REFERENCE, **params
+    ) -> Any:
+        """
+        The engine's ``compute_part_one/two(read_input(path), **params)``, cached.
+        """
+        digest = input_digest(path)
+        key = _entry_key(
+            day, part, engine, sorted(params.items()), solver_version(day), digest
+        )
+        answer = self.load(day, key)
+        if answer is MISSING:
+            compute = engines(day)[engine].compute(part)
+            answer = compute(self.parse(day, path, digest, engine), **params)
+            self.store(day, key, answer)
+        return answer
+
+
+def main(args):
+    store = Cache(directory=args.cache_dir)
+    if args.action == "clear":
+        store.invalidate(args.day)
+    else:
+        entries = store.entries()
+        print(f"{store.directory}")
+        print(
+            f"{len(entries)} entries, {sum(e.st_size for e in entries) / 2**20:.1f} MB"
+        )
+    return 0
+
+
+def add_cache_arguments(parser):
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse cached parsed inputs and answers",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_DIRECTORY,
+        help="cache directory (default: %(default)s, or $AOC_CACHE_DIR)",
+    )
+
+
+def configure_parser(subparsers):
+    parser = subparsers.add_parser("cache", help="inspect or clear the result cache")
+    parser.add_argument("action", choices=["info", "clear"])
+    parser.add_argument(
+        "day", type=int, nargs="?", help="clear only this day's entries"
+    )
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_DIRECTORY)
+    parser.set_defaults(func=main)
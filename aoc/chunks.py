@@ -0,0 +1,116 @@
+"""
+Parallel reductions over the lines of large inputs.
+
+``map_chunks`` memory-maps the input, cuts it into chunks that end on a line
+boundary and calls a function on every chunk in a pool of worker processes,
+which map the file themselves so that only offsets and results are pickled.
+The caller combines the partial results, e.g. with ``sum``. Compressed inputs
+and stdin cannot be mapped, their chunks are read from the stream and processed
+one after the other in this process.
+
+The function must be importable by the workers, i.e. defined at the top level
+of a module, a day module loaded by ``aoc.days.load_day`` included.
+"""
+
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterator, TypeVar
+
+from aoc.streams import GZIP_MAGIC, STDIN, ZSTD_MAGIC, open_binary
+
+R = TypeVar("R")
+
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class MappedInput:
+    """
+    Input of a chunked engine: its path, read by ``map_chunks`` only.
+    It cannot be pickled, so that ``aoc.cache`` never stores a path in place of
+    content that may have changed or moved since.
+    """
+
+    path: str
+
+    def __reduce__(self):
+        raise TypeError("a MappedInput refers to a path, its content is not stored")
+
+
+def chunk_bounds(buffer, nb_chunks: int) -> list[tuple[int, int]]:
+    """
+    (start, end) offsets of at most ``nb_chunks`` chunks of about the same size,
+    every chunk but the last ending just after a newline.
+    """
+    size = len(buffer)
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    for i in range(1, nb_chunks + 1):
+        if start >= size:
+            break
+        end = size if i == nb_chunks else max(start, size * i // nb_chunks)
+        if end < size:
+            newline = buffer.find(b"\n", end)
+            end = size if newline == -1 else newline + 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _mappable(path: str) -> bool:
+    if path == STDIN:
+        return False
+    with open(path, "rb") as f:
+        head = f.read(len(ZSTD_MAGIC))
+    return not (head.startswith(GZIP_MAGIC) or head.startswith(ZSTD_MAGIC))
+
+
+def _map_chunk(func: Callable[[bytes], R], path: str, start: int, end: int) -> R:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        return func(m[start:end])
+
+
+def _stream_chunks(path: str, chunk_bytes: int) -> Iterator[bytes]:
+    with open_binary(path) as stream:
+        while lines := stream.readlines(chunk_bytes):
+            yield b"".join(lines)
+
+
+def map_chunks(
+    func: Callable[[bytes], R],
+    path: str,
+    workers: int | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> list[R]:
+    """
+    ``func`` of every chunk of whole lines of the input, in input order.
+    Chunks hold about ``chunk_bytes``, and there are at least as many as workers.
+    With a single worker, or an input that fits in one chunk, they are processed
+    in this process.
+    """
+    path = str(path)
+    if not _mappable(path):
+        return [func(chunk) for chunk in _stream_chunks(path, chunk_bytes)]
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    workers = workers or os.cpu_count() or 1
+    nb_chunks = -(-size // chunk_bytes)
+    if workers > 1 and nb_chunks > 1:
+        nb_chunks = max(workers, nb_chunks)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        bounds = chunk_bounds(m, nb_chunks)
+        if workers == 1 or len(bounds) == 1:
+            return [func(m[start:end]) for start, end in bounds]
+    method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(bounds)),
+        mp_context=multiprocessing.get_context(method),
+    ) as executor:
+        futures = [
+            executor.submit(_map_chunk, func, path, start, end) for start, end in bounds
+        ]
+        return [future.result() for future in futures]
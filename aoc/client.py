@@ -0,0 +1,110 @@
+"""
+Client of the warm solver daemon started by ``aoc serve``.
+
+    python -m aoc.client 5 05/input.txt
+    python -m aoc.client 9 < 09/input.txt
+
+prints the answers like ``python main.py`` would. This module only imports the
+standard library modules it needs, so that a run costs an interpreter startup and
+a socket round trip, not the import of the solvers.
+
+The protocol is one JSON object per line in each direction. A request names the
+day, the part and either a ``path`` readable by the daemon or the ``input`` text
+itself, optionally an ``engine``; the response is the PartResult of the run, as a dict.
+``{"command": "ping"}`` and ``{"command": "shutdown"}`` are also understood.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+DEFAULT_SOCKET = Path(
+    os.environ.get("AOC_SOCKET")
+    or Path(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir())
+    / f"aoc-{os.getuid()}.sock"
+)
+
+
+class Client:
+    def __init__(self, path: Path = DEFAULT_SOCKET):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(str(path))
+        self.file = self.socket.makefile("rwb")
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
+
+    def request(self, **request) -> dict[str, Any]:
+        self.file.write(json.dumps(request).encode() + b"\n")
+        self.file.flush()
+        response = json.loads(self.file.readline())
+        if response.get("error"):
+            raise RuntimeError(response["error"])
+        return response
+
+    def solve(
+        self,
+        day: int,
+        part: int,
+        path: str | None = None,
+        text: str | None = None,
+        engine: str = "reference",
+    ):
+        if text is not None:
+            return self.request(day=day, part=part, input=text, engine=engine)
+        return self.request(
+            day=day, part=part, path=str(Path(path).resolve()), engine=engine
+        )
+
+
+def main(args):
+    with Client(args.socket) as client:
+        if args.shutdown:
+            client.request(command="shutdown")
+            return 0
+        if args.day is None:
+            raise SystemExit("aoc client: a day is required")
+        text = sys.stdin.read() if args.input == "-" else None
+        path = None if text is not None else args.input
+        for part in args.part or [1, 2]:
+            try:
+                print(
+                    client.solve(
+                        args.day, part, path=path, text=text, engine=args.engine
+                    )["answer"]
+                )
+            except RuntimeError as e:
+                print(f"ERROR {e}", file=sys.stderr)
+                return 1
+    return 0
+
+
+def configure_parser(subparsers):
+    parser = subparsers.add_parser("client", help="solve a day through the daemon")
+    parser.add_argument("day", type=int, nargs="?")
+    parser.add_argument(
+        "input", nargs="?", default="-", help="input path, '-' for stdin (default)"
+    )
+    parser.add_argument("-p", "--part", type=int, choices=[1, 2], action="append")
+    parser.add_argument("-e", "--engine", default="reference")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    parser.add_argument("--shutdown", action="store_true", help="stop the daemon")
+    parser.set_defaults(func=main)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="aoc.client")
+    configure_parser(parser.add_subparsers(required=True))
+    sys.exit(main(parser.parse_args(["client", *sys.argv[1:]])))
@@ -0,0 +1,131 @@
+"""
+Warm solver daemon.
+
+``aoc serve`` imports every day once, then forks a pool of workers that inherit
+the loaded modules, and answers the requests of ``aoc.client`` on a Unix domain
+socket, see there for the protocol. Each worker keeps its own ``Cache`` for its
+whole life, so that the in-memory entries stay warm from one request to the next.
+"""
+
+import json
+import multiprocessing
+import os
+import socketserver
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from aoc.cache import Cache, add_cache_arguments
+from aoc.client import DEFAULT_SOCKET
+from aoc.days import REFERENCE, available_days, load_day
+from aoc.runner import run_part
+
+# Cache of the worker process, set by init_worker
+_cache: Cache | None = None
+
+
+def preload() -> list[int]:
+    days = available_days()
+    for day in days:
+        load_day(day)
+    return days
+
+
+def init_worker(cache: Cache | None):
+    global _cache
+    _cache = cache
+    preload()
+
+
+def solve_request(request: dict[str, Any]) -> dict[str, Any]:
+    day, part = int(request["day"]), int(request["part"])
+    engine = request.get("engine", REFERENCE)
+    if "input" not in request:
+        return asdict(run_part(day, part, request["path"], _cache, engine=engine))
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as f:
+        f.write(request["input"])
+        f.flush()
+        res = run_part(day, part, f.name, _cache, engine=engine)
+    res.path = "-"
+    return asdict(res)
+
+
+class Handler(socketserver.StreamRequestHandler):
+    server: "Server"
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                response = self.server.respond(request)
+            except Exception as e:
+                response = {"error": repr(e)}
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, workers: int | None, cache: Cache | None):
+        self.days = preload()
+        method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context(method),
+            initializer=init_worker,
+            initargs=(cache,),
+        )
+        # Forks the workers now, before the server starts any thread
+        self.executor.submit(preload).result()
+        path.unlink(missing_ok=True)
+        super().__init__(str(path), Handler)
+
+    def respond(self, request: dict[str, Any]) -> dict[str, Any]:
+        match request.get("command", "solve"):
+            case "ping":
+                return {"days": self.days, "pid": os.getpid()}
+            case "shutdown":
+                threading.Thread(target=self.shutdown).start()
+                return {}
+            case "solve":
+                future = self.executor.submit(solve_request, request)
+                return future.result()
+            case command:
+                raise ValueError(f"unknown command {command!r}")
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+        Path(self.server_address).unlink(missing_ok=True)
+
+
+def serve(path: Path, workers: int | None = None, cache: Cache | None = None):
+    with Server(path, workers, cache) as server:
+        print(f"serving days {server.days} on {path}", file=sys.stderr)
+        server.serve_forever()
+
+
+def main(args):
+    serve(
+        args.socket,
+        workers=args.workers,
+        cache=Cache(directory=args.cache_dir) if args.cache else None,
+    )
+    return 0
+
+
+def configure_parser(subparsers):
+    parser = subparsers.add_parser(
+        "serve", help="preload every day and answer solve requests on a socket"
+    )
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    parser.add_argument(
+        "-j", "--workers", type=int, help="worker processes (default: one per core)"
+    )
+    add_cache_arguments(parser)
+    parser.set_defaults(func=main)
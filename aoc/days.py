@@ -0,0 +1,103 @@
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_INPUT = "{day}/input.txt"
+
+PARTS = {1: "part_one", 2: "part_two"}
+
+
+def available_days() -> list[int]:
+    return sorted(
+        int(path.parent.parent.name) for path in ROOT.glob("[0-9][0-9]/python/main.py")
+    )
+
+
+def day_dir(day: int) -> Path:
+    return ROOT / f"{day:02d}"
+
+
+@cache
+def load_day(day: int) -> ModuleType:
+    """
+    Import ``NN/python/main.py`` as module ``aoc_dayNN``, once per process.
+    The day folders are not valid package names, hence the loading by path.
+    """
+    module_name = f"aoc_day{day:02d}"
+    path = day_dir(day) / "python" / "main.py"
+    if not path.exists():
+        raise ValueError(f"no solution for day {day}")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    # Registered so that pickle can find the day's classes by module name
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@dataclass(frozen=True)
+class Engine:
+    """
+    Implementation of a day: ``read_input`` and one compute function per part,
+    with the signatures of the day module's own. A day module may offer
+    alternatives to its own functions in an ``ENGINES`` dict of named engines.
+    """
+
+    read_input: Callable[[str], Any]
+    compute_part_one: Callable[[Any], Any] | None = None
+    compute_part_two: Callable[[Any], Any] | None = None
+
+    def compute(self, part: int) -> Callable[[Any], Any] | None:
+        return getattr(self, f"compute_{PARTS[part]}")
+
+
+REFERENCE = "reference"
+
+
+def engines(day: int) -> dict[str, Engine]:
+    """
+    The day's engines by name, its own functions being the ``"reference"`` one.
+    """
+    module = load_day(day)
+    reference = Engine(
+        read_input=module.read_input,
+        compute_part_one=getattr(module, "compute_part_one", None),
+        compute_part_two=getattr(module, "compute_part_two", None),
+    )
+    return {REFERENCE: reference, **getattr(module, "ENGINES", {})}
+
+
+def input_path(day: int, template: str = DEFAULT_INPUT) -> Path:
+    path = Path(template.format(day=f"{day:02d}"))
+    if not path.is_absolute() and not path.exists():
+        path = ROOT / path
+    return path
+
+
+def parse_days(specs: list[str]) -> list[int]:
+    """
+    Parse day selections such as ``["3", "5-7"]``. An empty selection means every day.
+    """
+    if not specs:
+        return available_days()
+    existing = available_days()
+    days: list[int] = []
+    for spec in specs:
+        for token in spec.split(","):
+            match = re.fullmatch(r"(\d+)(?:-(\d+))?", token.strip())
+            if not match:
+                raise ValueError(f"invalid day selection: {token!r}")
+            first = int(match.group(1))
+            last = int(match.group(2) or first)
+            selected = range(first, last + 1)
+            if match.group(2):
+                selected = [day for day in selected if day in existing]
+            days.extend(day for day in selected if day not in days)
+    return days
@@ -0,0 +1,311 @@
+"""
+Differential testing of a day's alternative engines against its reference
+implementation, the functions of ``main.py`` whose answers are the oracle.
+
+Every engine runs on the day's examples, its real input and seeded random
+inputs from ``aoc.generators``. Cases where the reference itself fails, such as
+an example written for the other part, are skipped. For each mismatch the input
+is shrunk, by removing lines for as long as the engines still disagree, down to
+a minimal failing input. Every case also reports the reference to engine time
+ratio.
+
+    python -m aoc diff 1 2 --seeds 20
+"""
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc import generators
+from aoc.days import PARTS, REFERENCE, Engine, day_dir, engines, parse_days
+
+# Generator sizes of the random inputs, small enough for the reference to be quick
+RANDOM_SIZES = {
+    1: 200,
+    2: 200,
+    3: 30,
+    4: 200,
+    5: 10,
+    6: 4,
+    7: 200,
+    8: 200,
+    9: 200,
+    10: 15,
+    11: 30,
+    12: 30,
+    13: 20,
+    15: 500,
+    16: 15,
+    17: 8,
+    18: 100,
+    19: 30,
+    20: 1,
+}
+
+
+@dataclass()
+class Case:
+    day: int
+    part: int
+    engine: str
+    source: str
+    status: str = "ok"
+    expected: Any = None
+    actual: Any = None
+    reference_seconds: float | None = None
+    engine_seconds: float | None = None
+    minimal_input: str | None = None
+
+    @property
+    def speedup(self) -> float | None:
+        if not self.reference_seconds or not self.engine_seconds:
+            return None
+        return self.reference_seconds / self.engine_seconds
+
+
+def _answer(engine: Engine, part: int, path: str) -> str:
+    """
+    The answer as a string, so that engines returning e.g. NumPy integers compare
+    equal to the reference.
+    """
+    return str(engine.compute(part)(engine.read_input(path)))
+
+
+def timed(func: Callable, *args, repeat: int = 1) -> tuple[Any, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        res = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return res, best
+
+
+def _with_text(text: str, func: Callable[[str], Any]) -> Any:
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        f.write(text)
+    try:
+        return func(f.name)
+    finally:
+        os.unlink(f.name)
+
+
+def disagree(reference: Engine, engine: Engine, part: int, text: str) -> bool:
+    """
+    Whether the engine fails or differs on an input the reference solves.
+    """
+
+    def check(path: str) -> bool:
+        try:
+            expected = _answer(reference, part, path)
+        except Exception:
+            return False
+        try:
+            return _answer(engine, part, path) != expected
+        except Exception:
+            return True
+
+    return _with_text(text, check)
+
+
+def shrink(
+    reference: Engine, engine: Engine, part: int, text: str, max_tries: int = 500
+) -> str:
+    """
+    Smallest input found by removing ever smaller runs of lines from ``text``
+    while the engines keep disagreeing, as in delta debugging.
+    """
+    lines = text.splitlines()
+    chunk = max(1, len(lines) // 2)
+    tries = 0
+    while tries < max_tries:
+        removed = False
+        start = 0
+        while start < len(lines) and tries < max_tries:
+            candidate = lines[:start] + lines[start + chunk :]
+            tries += 1
+            if candidate and disagree(
+                reference, engine, part, "\n".join(candidate) + "\n"
+            ):
+                lines = candidate
+                removed = True
+            else:
+                start += chunk
+        if not removed:
+            if chunk == 1:
+                break
+            chunk = max(1, chunk // 2)
+    return "\n".join(lines) + "\n"
+
+
+def sources(
+    day: int, examples: bool, real: bool, nb_seeds: int, directory: Path
+) -> list[tuple[str, Path]]:
+    """
+    (name, path) of every input, random ones being written into ``directory``.
+    """
+    res: list[tuple[str, Path]] = []
+    if examples:
+        res.extend(
+            (path.name, path) for path in sorted(day_dir(day).glob("example*.txt"))
+        )
+    if real and (day_dir(day) / "input.txt").exists():
+        res.append(("input.txt", day_dir(day) / "input.txt"))
+    if nb_seeds and day in generators.GENERATORS:
+        size = RANDOM_SIZES.get(day, 100)
+        for seed in range(nb_seeds):
+            path = directory / f"{day:02d}-{size}-{seed}.txt"
+            with open(path, "w") as f:
+                generators.write_input(day, size, f, seed=seed)
+            res.append((f"random size={size} seed={seed}", path))
+    return res
+
+
+def compare(
+    day: int,
+    parts: list[int],
+    engine_names: list[str] | None = None,
+    examples: bool = True,
+    real: bool = True,
+    nb_seeds: int = 5,
+    repeat: int = 3,
+) -> list[Case]:
+    day_engines = engines(day)
+    reference = day_engines[REFERENCE]
+    names = engine_names or [name for name in day_engines if name != REFERENCE]
+    cases: list[Case] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for source, path in sources(day, examples, real, nb_seeds, Path(directory)):
+            for part in parts:
+                part_cases = [
+                    Case(day=day, part=part, engine=name, source=source)
+                    for name in names
+                    if day_engines[name].compute(part) is not None
+                ]
+                if part_cases:
+                    compare_part(reference, day_engines, part_cases, str(path), repeat)
+                cases.extend(part_cases)
+    return cases
+
+
+def compare_part(
+    reference: Engine,
+    day_engines: dict[str, Engine],
+    cases: list[Case],
+    path: str,
+    repeat: int,
+):
+    """
+    Fill in the cases of one part on one input.
+    """
+    part = cases[0].part
+    try:
+        expected, reference_seconds = timed(
+            _answer, reference, part, path, repeat=repeat
+        )
+    except Exception:
+        for case in cases:
+            case.status = "skipped"
+        return
+    for case in cases:
+        engine = day_engines[case.engine]
+        case.expected, case.reference_seconds = expected, reference_seconds
+        try:
+            case.actual, case.engine_seconds = timed(
+                _answer, engine, part, path, repeat=repeat
+            )
+        except Exception as e:
+            case.status, case.actual = "error", repr(e)
+        else:
+            if case.actual != expected:
+                case.status = "mismatch"
+        if case.status != "ok":
+            text = Path(path).read_text()
+            case.minimal_input = shrink(reference, engine, part, text)
+
+
+def _format_speedup(case: Case) -> str:
+    return "-" if case.speedup is None else f"{case.speedup:.2f}x"
+
+
+def format_cases(cases: list[Case]) -> str:
+    header = ("day", "part", "engine", "status", "speedup", "source")
+    rows = [header] + [
+        (
+            f"{c.day:02d}",
+            str(c.part),
+            c.engine,
+            c.status,
+            _format_speedup(c),
+            c.source,
+        )
+        for c in cases
+    ]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header) - 1)]
+    lines = [
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths))
+        + "  "
+        + row[-1]
+        for row in rows
+    ]
+    for c in cases:
+        if c.status in ("mismatch", "error"):
+            lines.append("")
+            lines.append(
+                f"day {c.day:02d} part {c.part} {c.engine} on {c.source}:"
+                f" expected {c.expected}, got {c.actual}, minimal input:"
+            )
+            lines.append(c.minimal_input.rstrip("\n"))
+    return "\n".join(lines)
+
+
+def main(args):
+    cases: list[Case] = []
+    for day in parse_days(args.days):
+        cases.extend(
+            compare(
+                day,
+                parts=args.part or list(PARTS),
+                engine_names=args.engine,
+                examples=not args.no_examples,
+                real=not args.no_input,
+                nb_seeds=args.seeds,
+                repeat=args.repeat,
+            )
+        )
+    if args.json:
+        print(json.dumps([asdict(c) | {"speedup": c.speedup} for c in cases], indent=2))
+    elif cases:
+        print(format_cases(cases))
+    else:
+        print("no alternative engine for these days")
+    return 1 if any(c.status in ("mismatch", "error") for c in cases) else 0
+
+
+def configure_parser(subparsers):
+    parser = subparsers.add_parser(
+        "diff", help="check alternative engines against the reference solvers"
+    )
+    parser.add_argument(
+        "days", nargs="*", help="days to check, e.g. 3 5-7 (all by default)"
+    )
+    parser.add_argument("-p", "--part", type=int, choices=list(PARTS), action="append")
+    parser.add_argument(
+        "-e", "--engine", action="append", help="engines to check (default: all)"
+    )
+    parser.add_argument(
+        "--seeds", type=int, default=5, help="random inputs per day (default: 5)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="runs timed per case, the best is kept (default: %(default)s)",
+    )
+    parser.add_argument("--no-examples", action="store_true")
+    parser.add_argument("--no-input", action="store_true", help="skip input.txt")
+    parser.add_argument("--json", action="store_true", help="print cases as JSON")
+    parser.set_defaults(func=main)
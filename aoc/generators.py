@@ -0,0 +1,581 @@
+"""
+Synthetic, valid puzzle inputs of arbitrary size, for benchmarking beyond the
+puzzle sizes. Every generator takes a ``random.Random`` and a size knob and
+yields the input lines; ``generate`` and ``write_input`` wrap them with a seed.
+"""
+
+import random
+import string
+from collections import deque
+from typing import Callable, Iterator, TextIO
+
+Generator = Callable[[random.Random, int], Iterator[str]]
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def unique_names(rng: random.Random, nb_names: int, forbidden=()) -> list[str]:
+    width = 2
+    while 26**width < 4 * (nb_names + len(forbidden)):
+        width += 1
+    names: set[str] = set()
+    while len(names) < nb_names:
+        name = "".join(rng.choices(string.ascii_lowercase, k=width))
+        if name not in forbidden:
+            names.add(name)
+    res = sorted(names)
+    rng.shuffle(res)
+    return res
+
+
+def day01(rng: random.Random, size: int) -> Iterator[str]:
+    """size: number of calibration lines."""
+    for _ in range(size):
+        chunks = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 6)):
+            match rng.randrange(3):
+                case 0:
+                    chunks.append(str(rng.randint(1, 9)))
+                case 1:
+                    chunks.append(rng.choice(DIGIT_WORDS))
+                case _:
+                    chunks.append(
+                        "".join(
+                            rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))
+                        )
+                    )
+        rng.shuffle(chunks)
+        yield "".join(chunks)
+
+
+def day02(rng: random.Random, size: int) -> Iterator[str]:
+    """size: number of games."""
+    for game_id in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], k=rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        yield f"Game {game_id}: " + "; ".join(draws)
+
+
+def day03(rng: random.Random, size: int) -> Iterator[str]:
+    """size: side of the square schematic."""
+    symbols = "*#+$/@=%&-"
+    for _ in range(size):
+        row: list[str] = []
+        while len(row) < size:
+            draw = rng.random()
+            if draw < 0.12:
+                row.extend(str(rng.randint(1, 999)))
+                row.append(".")
+            elif draw < 0.18:
+                row.append(rng.choice(symbols))
+            else:
+                row.append(".")
+        yield "".join(row[:size])
+
+
+def day04(rng: random.Random, size: int) -> Iterator[str]:
+    """
+    size: number of cards.
+    Matches are drawn with a mean below one so that part two copies stay bounded.
+    """
+    nb_matches_weights = {0: 60, 1: 20, 2: 10, 3: 5, 5: 3, 10: 2}
+    width = len(str(size))
+    for card_id in range(1, size + 1):
+        nb_matches = rng.choices(
+            list(nb_matches_weights), weights=list(nb_matches_weights.values())
+        )[0]
+        numbers = rng.sample(range(1, 100), k=35 - nb_matches)
+        winning, others = numbers[:10], numbers[10:]
+        mine = others + rng.sample(winning, k=nb_matches)
+        rng.shuffle(mine)
+        winning_str = " ".join(f"{n:2d}" for n in winning)
+        mine_str = " ".join(f"{n:2d}" for n in mine)
+        yield f"Card {card_id:>{width}}: {winning_str} | {mine_str}"
+
+
+def day05(rng: random.Random, size: int, nb_layers: int = 7) -> Iterator[str]:
+    """size: number of seed ranges and of ranges per map layer."""
+    max_value = 2**32
+    seeds = []
+    for _ in range(size):
+        start = rng.randrange(max_value // 2)
+        seeds.extend([start, rng.randint(1, max_value // (4 * size))])
+    yield "seeds: " + " ".join(map(str, seeds))
+    layer_names = [
+        "seed",
+        "soil",
+        "fertilizer",
+        "water",
+        "light",
+        "temperature",
+        "humidity",
+    ]
+    layer_names.extend(f"layer{i}" for i in range(len(layer_names), nb_layers))
+    layer_names = layer_names[:nb_layers] + ["location"]
+    for origin, destination in zip(layer_names, layer_names[1:]):
+        yield ""
+        yield f"{origin}-to-{destination} map:"
+        bounds = sorted(rng.sample(range(max_value), k=2 * size))
+        for low, high in zip(bounds[::2], bounds[1::2]):
+            length = high - low
+            yield f"{rng.randrange(max_value - length)} {low} {length}"
+
+
+def day06(rng: random.Random, size: int) -> Iterator[str]:
+    """size: number of races."""
+    durations = [rng.randint(10, 100) for _ in range(size)]
+    records = [rng.randint(duration, duration**2 // 4 - 1) for duration in durations]
+    yield "Time:     " + " ".join(f"{d:>6}" for d in durations)
+    yield "Distance: " + " ".join(f"{r:>6}" for r in records)
+
+
+def day07(rng: random.Random, size: int) -> Iterator[str]:
+    """size: number of hands."""
+    labels = "AKQJT98765432"
+    for _ in range(size):
+        yield "".join(rng.choices(labels, k=5)) + f" {rng.randint(1, 1000)}"
+
+
+def day08(rng: random.Random, size: int, nb_ghosts: int = 6) -> Iterator[str]:
+    """
+    size: number of nodes.
+    Every ghost walks its own cycle, the first one from AAA to ZZZ.
+    """
+    directions = "".join(rng.choices("LR", k=rng.randint(50, 300)))
+    yield directions
+    yield ""
+    width = 3
+    while 24 * 26 ** (width - 1) < size:
+        width += 1
+    inner_names = set()
+    while len(inner_names) < size:
+        name = "".join(rng.choices(string.ascii_uppercase, k=width - 1))
+        inner_names.add(name + rng.choice(string.ascii_uppercase[1:-1]))
+    inner = list(inner_names)
+    chain_length = max(2, size // nb_ghosts)
+    lines = []
+    for ghost in range(nb_ghosts):
+        prefix = "A" * (width - 1) if ghost == 0 else f"{ghost:0{width - 1}d}"
+        start = prefix + "A"
+        end = ("Z" * (width - 1) if ghost == 0 else prefix) + "Z"
+        chain = inner[ghost * chain_length : (ghost + 1) * chain_length]
+        nodes = [start] + chain + [end]
+        for node, next_node in zip(nodes, nodes[1:]):
+            lines.append(f"{node} = ({next_node}, {next_node})")
+        lines.append(f"{end} = ({nodes[1]}, {nodes[1]})")
+    rng.shuffle(lines)
+    yield from lines
+
+
+def day09(rng: random.Random, size: int) -> Iterator[str]:
+    """size: number of histories."""
+    for _ in range(size):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 6))]
+        yield " ".join(
+            str(sum(c * x**i for (i, c) in enumerate(coefficients))) for x in range(21)
+        )
+
+
+def _random_tree(
+    rng: random.Random, nb_rows: int, nb_cols: int, fill: float
+) -> tuple[set[tuple[int, int]], set[frozenset[tuple[int, int]]]]:
+    start = (rng.randrange(nb_rows), rng.randrange(nb_cols))
+    nodes = {start}
+    edges: set[frozenset[tuple[int, int]]] = set()
+    frontier = [
+        (start, neighbour) for neighbour in _neighbours(start, nb_rows, nb_cols)
+    ]
+    target = max(1, int(fill * nb_rows * nb_cols))
+    while frontier and len(nodes) < target:
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        parent, node = frontier.pop()
+        if node in nodes:
+            continue
+        nodes.add(node)
+        edges.add(frozenset((parent, node)))
+        frontier.extend(
+            (node, neighbour)
+            for neighbour in _neighbours(node, nb_rows, nb_cols)
+            if neighbour not in nodes
+        )
+    return nodes, edges
+
+
+def _neighbours(cell, nb_rows, nb_cols):
+    i, j = cell
+    for i2, j2 in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)):
+        if 0 <= i2 < nb_rows and 0 <= j2 < nb_cols:
+            yield (i2, j2)
+
+
+def random_loop(
+    rng: random.Random, nb_rows: int, nb_cols: int, fill: float = 0.6, scale: int = 1
+):
+    """
+    Simple closed rectilinear loop on the corners of a scale * (2 * nb_rows + 1)
+    by scale * (2 * nb_cols + 1) cell grid: the outline of a thickened random
+    tree, which never touches itself. Returns the corners in walking order.
+    """
+    nodes, edges = _random_tree(rng, nb_rows, nb_cols, fill)
+    tree_cells = {(2 * i + 1, 2 * j + 1) for (i, j) in nodes}
+    for edge in edges:
+        (i1, j1), (i2, j2) = edge
+        tree_cells.add((i1 + i2 + 1, j1 + j2 + 1))
+    filled = {
+        (scale * i + di, scale * j + dj)
+        for (i, j) in tree_cells
+        for di in range(scale)
+        for dj in range(scale)
+    }
+
+    corner_neighbours: dict[tuple[int, int], list[tuple[int, int]]] = {}
+    for i, j in filled:
+        for cell, corners in (
+            ((i - 1, j), ((i, j), (i, j + 1))),
+            ((i + 1, j), ((i + 1, j), (i + 1, j + 1))),
+            ((i, j - 1), ((i, j), (i + 1, j))),
+            ((i, j + 1), ((i, j + 1), (i + 1, j + 1))),
+        ):
+            if cell not in filled:
+                a, b = corners
+                corner_neighbours.setdefault(a, []).append(b)
+                corner_neighbours.setdefault(b, []).append(a)
+
+    start = min(corner_neighbours)
+    loop = [start]
+    previous, current = start, corner_neighbours[start][0]
+    while current != start:
+        loop.append(current)
+        a, b = corner_neighbours[current]
+        previous, current = current, (b if a == previous else a)
+    return loop
+
+
+def day10(rng: random.Random, size: int) -> Iterator[str]:
+    """size: side of the square maze."""
+    half = max(1, (size - 3) // 4)
+    loop = random_loop(rng, half, half, fill=rng.uniform(0.3, 0.8), scale=2)
+    side = 4 * half + 3
+    grid = [rng.choices("|-LJ7F...", k=side) for _ in range(side)]
+    tiles = {
+        frozenset("NS"): "|",
+        frozenset("EW"): "-",
+        frozenset("NE"): "L",
+        frozenset("NW"): "J",
+        frozenset("SW"): "7",
+        frozenset("SE"): "F",
+    }
+    for k, (i, j) in enumerate(loop):
+        ways = set()
+        for i2, j2 in (loop[k - 1], loop[(k + 1) % len(loop)]):
+            ways.add("N" if i2 < i else "S" if i2 > i else "W" if j2 < j else "E")
+        grid[i][j] = tiles[frozenset(ways)]
+    # The part two ray casting treats S as a crossing, so S must not be an L or a 7
+    si, sj = rng.choice([(i, j) for (i, j) in loop if grid[i][j] not in "L7"])
+    grid[si][sj] = "S"
+    on_loop = set(loop)
+    for i, j in _neighbours((si, sj), side, side):
+        if (i, j) not in on_loop:
+            grid[i][j] = "."
+    for row in grid:
+        yield "".join(row)
+
+
+def day11(rng: random.Random, size: int) -> Iterator[str]:
+    """size: side of the square image."""
+    empty_rows = set(rng.sample(range(size), k=size // 10))
+    empty_cols = set(rng.sample(range(size), k=size // 10))
+    for i in range(size):
+        yield "".join(
+            (
+                "#"
+                if i not in empty_rows and j not in empty_cols and rng.random() < 0.02
+                else "."
+            )
+            for j in range(size)
+        )
+
+
+def day12(rng: random.Random, size: int) -> Iterator[str]:
+    """size: number of records."""
+    for _ in range(size):
+        springs = "".join(rng.choices("#.", k=rng.randint(4, 20)))
+        if "#" not in springs:
+            springs = "#" + springs[1:]
+        groups = [len(group) for group in springs.split(".") if group]
+        record = "".join("?" if rng.random() < 0.4 else char for char in springs)
+        yield record + " " + ",".join(map(str, groups))
+
+
+def _mismatches(pattern: list[str]) -> list[int]:
+    nb_cols = len(pattern[0])
+    res = []
+    for j in range(1, nb_cols):
+        length = min(j, nb_cols - j)
+        res.append(
+            sum(
+                ch1 != ch2
+                for line in pattern
+                for (ch1, ch2) in zip(
+                    line[j - length : j], line[j + length - 1 : j - 1 : -1]
+                )
+            )
+        )
+    return res
+
+
+def _day13_candidate(rng: random.Random) -> list[str]:
+    nb_rows, nb_cols = rng.randint(5, 17), rng.randint(5, 17)
+    column = rng.randint(1, (nb_cols - 1) // 2)
+    row = rng.randint(1, nb_rows // 2)
+
+    def mirror(i, window):
+        return i if i >= 2 * window else min(i, 2 * window - 1 - i)
+
+    base = [rng.choices("#.", k=nb_cols) for _ in range(nb_rows)]
+    grid = [
+        [base[mirror(i, row)][mirror(j, column)] for j in range(nb_cols)]
+        for i in range(nb_rows)
+    ]
+    # The smudge is outside the column reflection but inside the row reflection
+    i, j = rng.randrange(2 * row), rng.randrange(2 * column, nb_cols)
+    grid[i][j] = "#" if grid[i][j] == "." else "."
+    if rng.random() < 0.5:
+        grid = [line[::-1] for line in grid]
+    if rng.random() < 0.5:
+        grid = grid[::-1]
+    if rng.random() < 0.5:
+        grid = [list(line) for line in zip(*grid)]
+    return ["".join(line) for line in grid]
+
+
+def _day13_pattern(rng: random.Random) -> list[str]:
+    """
+    Pattern with exactly one clean reflection and exactly one line reflecting
+    with a single smudge.
+    """
+    while True:
+        pattern = _day13_candidate(rng)
+        mismatches = _mismatches(pattern) + _mismatches(
+            ["".join(line) for line in zip(*pattern)]
+        )
+        if mismatches.count(0) == 1 and mismatches.count(1) == 1:
+            return pattern
+
+
+def day13(rng: random.Random, size: int) -> Iterator[str]:
+    """size: number of patterns."""
+    for k in range(size):
+        if k:
+            yield ""
+        yield from _day13_pattern(rng)
+
+
+def day15(rng: random.Random, size: int) -> Iterator[str]:
+    """size: number of steps."""
+    labels = unique_names(rng, max(1, size // 4))
+    steps = (
+        rng.choice(labels) + ("-" if rng.random() < 0.3 else f"={rng.randint(1, 9)}")
+        for _ in range(size)
+    )
+    yield ",".join(steps)
+
+
+def day16(rng: random.Random, size: int) -> Iterator[str]:
+    """size: side of the square contraption."""
+    for _ in range(size):
+        yield "".join(
+            rng.choice("|-/\\") if rng.random() < 0.1 else "." for _ in range(size)
+        )
+
+
+def day17(rng: random.Random, size: int) -> Iterator[str]:
+    """size: side of the square city."""
+    for _ in range(size):
+        yield "".join(rng.choices("123456789", k=size))
+
+
+def day18(rng: random.Random, size: int) -> Iterator[str]:
+    """
+    size: roughly the number of dig instructions.
+    Both parts dig the same simple loop, stretched differently.
+    """
+    half = max(1, int((size / 2) ** 0.5))
+    loop = random_loop(rng, half, half)
+    side = 2 * half + 2
+
+    def stretch(max_gap):
+        return list(accumulate_gaps(rng, side, max_gap))
+
+    rows1, cols1 = stretch(10), stretch(10)
+    rows2, cols2 = stretch(100_000), stretch(100_000)
+    corners = [
+        k
+        for k in range(len(loop))
+        if loop[k - 1][0] != loop[(k + 1) % len(loop)][0]
+        and loop[k - 1][1] != loop[(k + 1) % len(loop)][1]
+    ]
+    vertices = [loop[k] for k in corners]
+    signed_area = sum(
+        j1 * i2 - j2 * i1
+        for ((i1, j1), (i2, j2)) in zip(vertices, vertices[1:] + vertices[:1])
+    )
+    if signed_area < 0:
+        vertices.reverse()
+    direction_codes = {"R": 0, "D": 1, "L": 2, "U": 3}
+    for (i1, j1), (i2, j2) in zip(vertices, vertices[1:] + vertices[:1]):
+        if i1 == i2:
+            direction = "R" if j2 > j1 else "L"
+            length1, length2 = abs(cols1[j2] - cols1[j1]), abs(cols2[j2] - cols2[j1])
+        else:
+            direction = "D" if i2 > i1 else "U"
+            length1, length2 = abs(rows1[i2] - rows1[i1]), abs(rows2[i2] - rows2[i1])
+        yield f"{direction} {length1} (#{length2:05x}{direction_codes[direction]})"
+
+
+def accumulate_gaps(rng: random.Random, nb_values: int, max_gap: int) -> Iterator[int]:
+    position = 0
+    for _ in range(nb_values):
+        yield position
+        position += rng.randint(1, max_gap)
+
+
+def day19(rng: random.Random, size: int) -> Iterator[str]:
+    """
+    size: number of workflows, and of part ratings.
+    Workflows form a tree whose conditions never leave an empty rating range.
+    """
+    names = iter(unique_names(rng, size - 1, forbidden={"in"}))
+    nb_workflows = 1
+    queue = deque([("in", {c: (1, 4000) for c in "xmas"})])
+    lines = []
+
+    def destination(ranges):
+        nonlocal nb_workflows
+        if nb_workflows < size and (not queue or rng.random() < 0.7):
+            nb_workflows += 1
+            name = next(names)
+            queue.append((name, ranges))
+            return name
+        return rng.choice("AR")
+
+    while queue:
+        name, ranges = queue.popleft()
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            splittable = [c for c in "xmas" if ranges[c][1] > ranges[c][0]]
+            if not splittable:
+                break
+            c = rng.choice(splittable)
+            low, high = ranges[c]
+            if rng.random() < 0.5:
+                value = rng.randint(low + 1, high)
+                matched, ranges = (low, value - 1), {**ranges, c: (value, high)}
+                condition = f"{c}<{value}"
+            else:
+                value = rng.randint(low, high - 1)
+                matched, ranges = (value + 1, high), {**ranges, c: (low, value)}
+                condition = f"{c}>{value}"
+            rules.append(f"{condition}:{destination({**ranges, c: matched})}")
+        rules.append(destination(ranges))
+        lines.append(name + "{" + ",".join(rules) + "}")
+    rng.shuffle(lines)
+    yield from lines
+    yield ""
+    for _ in range(size):
+        yield "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas") + "}"
+
+
+def day20(rng: random.Random, size: int, nb_bits: int = 12) -> Iterator[str]:
+    """
+    size: number of counters feeding rx, each made of nb_bits flip-flops and a
+    conjunction hub, so that rx gets a low pulse after the lcm of their periods.
+    """
+    names = unique_names(rng, size * (nb_bits + 2) + 1, forbidden={"rx"})
+    output = names.pop()
+    lines = []
+    first_bits = []
+    for _ in range(size):
+        bits = [names.pop() for _ in range(nb_bits)]
+        hub, inverter = names.pop(), names.pop()
+        first_bits.append(bits[0])
+        period = rng.randrange(2 ** (nb_bits - 1) + 1, 2**nb_bits, 2)
+        hub_destinations = [inverter]
+        for k, bit in enumerate(bits):
+            destinations = [bits[k + 1]] if k + 1 < nb_bits else []
+            if period >> k & 1:
+                destinations.append(hub)
+            if not period >> k & 1 or k == 0:
+                hub_destinations.append(bit)
+            if destinations:
+                lines.append(f"%{bit} -> " + ", ".join(destinations))
+        lines.append(f"&{hub} -> " + ", ".join(hub_destinations))
+        lines.append(f"&{inverter} -> {output}")
+    lines.append(f"&{output} -> rx")
+    rng.shuffle(lines)
+    yield "broadcaster -> " + ", ".join(first_bits)
+    yield from lines
+
+
+GENERATORS: dict[int, Generator] = {
+    1: day01,
+    2: day02,
+    3: day03,
+    4: day04,
+    5: day05,
+    6: day06,
+    7: day07,
+    8: day08,
+    9: day09,
+    10: day10,
+    11: day11,
+    12: day12,
+    13: day13,
+    15: day15,
+    16: day16,
+    17: day17,
+    18: day18,
+    19: day19,
+    20: day20,
+}
+
+
+def generate_lines(day: int, size: int, seed: int = 0) -> Iterator[str]:
+    try:
+        generator = GENERATORS[day]
+    except KeyError:
+        raise ValueError(f"no generator for day {day}") from None
+    return generator(random.Random(f"{day}-{size}-{seed}"), size)
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    return "".join(line + "\n" for line in generate_lines(day, size, seed))
+
+
+def write_input(day: int, size: int, file: TextIO, seed: int = 0):
+    for line in generate_lines(day, size, seed):
+        file.write(line)
+        file.write("\n")
+
+
+def main(args):
+    import sys
+
+    if args.output:
+        with open(args.output, "w") as f:
+            write_input(args.day, args.size, f, seed=args.seed)
+    else:
+        write_input(args.day, args.size, sys.stdout, seed=args.seed)
+    return 0
+
+
+def configure_parser(subparsers):
+    parser = subparsers.add_parser("generate", help="write a synthetic input for a day")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("-n", "--size", type=int, default=100)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="output path (stdout by default)")
+    parser.set_defaults(func=main)
@@ -0,0 +1,101 @@
+from typing import Iterator
+
+Position = tuple[int, int]
+
+
+class Grid:
+    """
+    Rectangular grid of one-byte cells stored row by row in a single bytearray.
+    Row i starts at offset i * stride. The stride may exceed the number of
+    columns, which lets a grid use the raw bytes of an input file, newlines
+    included, without copying them.
+
+    Indexing is not bounds checked: a column past the last one reads the row
+    separator, use ``in`` to test a position first.
+    """
+
+    __slots__ = ("data", "nb_rows", "nb_cols", "stride")
+
+    def __init__(self, data: bytearray, nb_rows: int, nb_cols: int, stride: int = 0):
+        self.data = data
+        self.nb_rows = nb_rows
+        self.nb_cols = nb_cols
+        self.stride = stride or nb_cols
+        if nb_rows and len(data) < (nb_rows - 1) * self.stride + nb_cols:
+            raise ValueError("buffer too small for the grid dimensions")
+
+    @classmethod
+    def from_buffer(cls, data: bytearray) -> "Grid":
+        """
+        Grid over rows of equal length ending with "\n" or "\r\n", sharing ``data``.
+        """
+        length = len(data)
+        while length and data[length - 1] in b"\r\n":
+            length -= 1
+        nb_cols = data.find(b"\n", 0, length)
+        if nb_cols == -1:
+            return cls(data, nb_rows=1 if length else 0, nb_cols=length)
+        # Row terminator, the last one stripped above
+        terminator = 2 if nb_cols and data[nb_cols - 1] == ord("\r") else 1
+        nb_cols -= terminator - 1
+        stride = nb_cols + terminator
+        nb_rows = (length + terminator) // stride
+        if nb_rows * stride != length + terminator:
+            raise ValueError("rows of unequal length")
+        return cls(data, nb_rows=nb_rows, nb_cols=nb_cols, stride=stride)
+
+    @classmethod
+    def read(cls, path) -> "Grid":
+        with open(path, "rb") as f:
+            data = bytearray(f.read())
+        return cls.from_buffer(data)
+
+    def __getitem__(self, position: Position) -> int:
+        i, j = position
+        return self.data[i * self.stride + j]
+
+    def __contains__(self, position: Position) -> bool:
+        i, j = position
+        return 0 <= i < self.nb_rows and 0 <= j < self.nb_cols
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.rows())
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.nb_rows, self.nb_cols
+
+    def row(self, i: int) -> memoryview:
+        start = i * self.stride
+        return memoryview(self.data)[start : start + self.nb_cols]
+
+    def column(self, j: int) -> memoryview:
+        stop = (self.nb_rows - 1) * self.stride + j + 1
+        return memoryview(self.data)[j : stop : self.stride]
+
+    def rows(self) -> Iterator[memoryview]:
+        for i in range(self.nb_rows):
+            yield self.row(i)
+
+    def columns(self) -> Iterator[memoryview]:
+        for j in range(self.nb_cols):
+            yield self.column(j)
+
+    def find_all(self, value: int) -> Iterator[Position]:
+        """
+        Positions of the cells equal to ``value``, row by row.
+        """
+        data, stride, nb_cols = self.data, self.stride, self.nb_cols
+        stop = (self.nb_rows - 1) * stride + nb_cols if self.nb_rows else 0
+        index = data.find(value, 0, stop)
+        while index != -1:
+            i, j = divmod(index, stride)
+            if j < nb_cols:
+                yield i, j
+            index = data.find(value, index + 1, stop)
+
+    def translated(self, table: bytes) -> "Grid":
+        """
+        Copy of the grid with every byte mapped through ``table``, as ``bytes.translate``.
+        """
+        return Grid(self.data.translate(table), self.nb_rows, self.nb_cols, self.stride)
@@ -0,0 +1,73 @@
+"""
+Import cost of the day modules, measured in a fresh interpreter with
+``python -X importtime`` so that nothing is already cached in ``sys.modules``.
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+from aoc.days import ROOT
+
+LOAD_DAY = """
+import time
+from aoc.days import load_day
+start = time.perf_counter()
+load_day({day})
+print(time.perf_counter() - start)
+"""
+
+
+@dataclass()
+class ImportReport:
+    day: int
+    load_wall: float
+    # (module, cumulative microseconds) of the top-level imports made by the day
+    modules: list[tuple[str, int]] = field(default_factory=list)
+
+
+def parse_importtime(stderr: str, after: str) -> list[tuple[str, int]]:
+    """
+    Top-level imports completed after module ``after``, slowest first.
+    Lines look like ``import time:  self [us] | cumulative | name``, nested
+    imports having their name indented.
+    """
+    modules, started = [], False
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):
+            continue
+        name = name.strip()
+        if started:
+            modules.append((name, int(cumulative)))
+        started = started or name == after
+    return sorted(modules, key=lambda module: module[1], reverse=True)
+
+
+def import_report(day: int) -> ImportReport:
+    pythonpath = [str(ROOT), os.environ.get("PYTHONPATH", "")]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, pythonpath)))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LOAD_DAY.format(day=day)],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+        check=True,
+    )
+    return ImportReport(
+        day=day,
+        load_wall=float(proc.stdout),
+        modules=parse_importtime(proc.stderr, after="aoc.days"),
+    )
+
+
+def format_reports(reports: list[ImportReport], top: int = 3) -> str:
+    lines = ["day  import ms  slowest imports (cumulative ms)"]
+    for r in reports:
+        modules = ", ".join(f"{name} {us / 1000:.1f}" for name, us in r.modules[:top])
+        lines.append(f"{r.day:02d}  {r.load_wall * 1000:9.1f}  {modules or '-'}")
+    return "\n".join(lines)
@@ -0,0 +1,151 @@
+"""
+Sets of integers stored as sorted, disjoint closed intervals.
+
+The bounds live in two parallel lists, ``lows`` and ``highs``, with
+``highs[i] + 1 < lows[i + 1]``: intervals never overlap nor touch, so every set
+has a single representation. Union, intersection and difference merge the two
+operands' bounds in one linear pass.
+"""
+
+from bisect import bisect_right
+from heapq import merge
+from typing import Iterable, Iterator
+
+
+class IntervalSet:
+    __slots__ = ("lows", "highs")
+
+    def __init__(self, lows: list[int] | None = None, highs: list[int] | None = None):
+        """
+        Bounds are taken as is and must already be normalized, see ``from_pairs``.
+        """
+        self.lows = lows if lows is not None else []
+        self.highs = highs if highs is not None else []
+
+    @classmethod
+    def closed(cls, low: int, high: int) -> "IntervalSet":
+        if low > high:
+            return cls()
+        return cls([low], [high])
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[tuple[int, int]]) -> "IntervalSet":
+        """
+        Union of closed ``(low, high)`` intervals given in any order.
+        """
+        return cls._coalesced(sorted(pairs))
+
+    @classmethod
+    def union_all(cls, sets: Iterable["IntervalSet"]) -> "IntervalSet":
+        """
+        Union of many sets at once, cheaper than folding them with ``|``.
+        """
+        return cls._coalesced(merge(*(iter(s) for s in sets)))
+
+    @classmethod
+    def _coalesced(cls, pairs: Iterable[tuple[int, int]]) -> "IntervalSet":
+        """
+        Set from intervals sorted by lower bound, merging those that overlap or touch.
+        """
+        lows: list[int] = []
+        highs: list[int] = []
+        for low, high in pairs:
+            if low > high:
+                continue
+            if highs and low <= highs[-1] + 1:
+                if high > highs[-1]:
+                    highs[-1] = high
+            else:
+                lows.append(low)
+                highs.append(high)
+        return cls(lows, highs)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.lows, self.highs)
+
+    def __len__(self) -> int:
+        """
+        Number of integers in the set.
+        """
+        return sum(self.highs) - sum(self.lows) + len(self.lows)
+
+    def __bool__(self) -> bool:
+        return bool(self.lows)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.lows == other.lows and self.highs == other.highs
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.lows, value) - 1
+        return i >= 0 and value <= self.highs[i]
+
+    def __repr__(self) -> str:
+        intervals = " | ".join(f"[{low},{high}]" for low, high in self)
+        return f"IntervalSet({intervals})"
+
+    @property
+    def lower(self) -> int:
+        return self.lows[0]
+
+    @property
+    def upper(self) -> int:
+        return self.highs[-1]
+
+    @property
+    def nb_intervals(self) -> int:
+        return len(self.lows)
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        return self._coalesced(merge(self, other))
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        lows: list[int] = []
+        highs: list[int] = []
+        a_lows, a_highs = self.lows, self.highs
+        b_lows, b_highs = other.lows, other.highs
+        i = j = 0
+        while i < len(a_lows) and j < len(b_lows):
+            low = max(a_lows[i], b_lows[j])
+            high = min(a_highs[i], b_highs[j])
+            if low <= high:
+                lows.append(low)
+                highs.append(high)
+            if a_highs[i] < b_highs[j]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet(lows, highs)
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        lows: list[int] = []
+        highs: list[int] = []
+        b_lows, b_highs = other.lows, other.highs
+        nb_b = len(b_lows)
+        j = 0
+        for low, high in self:
+            while j < nb_b and b_highs[j] < low:
+                j += 1
+            # Interval j of ``other`` may also cut into the next interval of ``self``
+            k = j
+            while k < nb_b and b_lows[k] <= high:
+                if b_lows[k] > low:
+                    lows.append(low)
+                    highs.append(b_lows[k] - 1)
+                low = max(low, b_highs[k] + 1)
+                if b_highs[k] > high:
+                    break
+                k += 1
+            if low <= high:
+                lows.append(low)
+                highs.append(high)
+            j = k
+        return IntervalSet(lows, highs)
+
+    def shifted(self, offset: int) -> "IntervalSet":
+        return IntervalSet(
+            [low + offset for low in self.lows], [high + offset for high in self.highs]
+        )
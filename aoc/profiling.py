@@ -0,0 +1,37 @@
+"""
+Phase-level profiling.
+
+Solvers mark their phases with ``phase``, as a context manager or a decorator::
+
+    with phase("build"):
+        ...
+
+Nothing is recorded unless an ``aoc.sessions.Session`` is active, so a disabled
+phase costs a global lookup. Days import this module when they load, it
+therefore holds nothing but ``phase``: the profilers are only imported with
+``aoc.sessions``.
+"""
+
+from contextlib import ContextDecorator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aoc.sessions import Session
+
+# Set by the active Session
+_session: "Session | None" = None
+
+
+class phase(ContextDecorator):
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        if _session is not None:
+            _session.enter(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        if _session is not None:
+            _session.exit(self.name)
+        return False
@@ -0,0 +1,76 @@
+"""
+Streaming access to input files through a read-only memory map.
+
+``blocks`` and ``tokens`` map the file and yield one ``bytes`` item at a time,
+so the file is never loaded whole nor split into a full list. Line-oriented
+inputs are read with ``aoc.streams`` instead.
+"""
+
+import mmap
+from contextlib import contextmanager
+from typing import Iterator
+
+# Anything with find and slicing
+Buffer = bytes | bytearray | mmap.mmap
+
+
+@contextmanager
+def mapped(path) -> Iterator[Buffer]:
+    """
+    Read-only memory map of the file. Empty files and files that cannot be
+    mapped (pipes, character devices) are read into memory instead.
+    """
+    with open(path, "rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield f.read()
+            return
+        with buffer:
+            yield buffer
+
+
+def spans(buffer: Buffer, separator: bytes, strip: bytes = b"") -> Iterator[slice]:
+    """
+    Slices of the non-empty items of ``buffer`` between separators, with the
+    bytes in ``strip`` removed at both ends of every item.
+    """
+    start, length = 0, len(buffer)
+    while start < length:
+        end = buffer.find(separator, start)
+        if end == -1:
+            end = length
+        low, high = start, end
+        while low < high and buffer[low] in strip:
+            low += 1
+        while high > low and buffer[high - 1] in strip:
+            high -= 1
+        if low < high:
+            yield slice(low, high)
+        start = end + len(separator)
+
+
+def _items(path, separator: bytes, strip: bytes) -> Iterator[bytes]:
+    with mapped(path) as buffer:
+        for span in spans(buffer, separator, strip):
+            yield buffer[span]
+
+
+def blocks(path) -> Iterator[bytes]:
+    """
+    Blocks of lines separated by blank lines, without surrounding newlines.
+    Lines end like the first one, with "\n" or "\r\n".
+    """
+    with mapped(path) as buffer:
+        newline = buffer.find(b"\n")
+        crlf = newline > 0 and buffer[newline - 1] == ord("\r")
+        separator = b"\r\n\r\n" if crlf else b"\n\n"
+        for span in spans(buffer, separator, strip=b"\r\n"):
+            yield buffer[span]
+
+
+def tokens(path, delimiter: bytes = b",") -> Iterator[bytes]:
+    """
+    Items separated by ``delimiter``, without surrounding whitespace.
+    """
+    return _items(path, delimiter, strip=b" \t\r\n")
@@ -0,0 +1,298 @@
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc.cache import Cache, add_cache_arguments
+from aoc.days import (
+    DEFAULT_INPUT,
+    PARTS,
+    REFERENCE,
+    engines,
+    input_path,
+    load_day,
+    parse_days,
+)
+from aoc.imports import format_reports, import_report
+from aoc.profiling import phase
+from aoc.sessions import Session
+
+
+@dataclass()
+class PartResult:
+    day: int
+    part: int
+    path: str
+    engine: str = REFERENCE
+    answer: Any = None
+    import_wall: float = 0.0
+    parse_wall: float | None = None
+    parse_cpu: float | None = None
+    solve_wall: float = 0.0
+    solve_cpu: float = 0.0
+    peak_rss_kb: int = 0
+    # Size of the input file as stored, compressed or not; None for stdin
+    input_bytes: int | None = None
+    error: str | None = None
+    profile: list[dict[str, Any]] | None = None
+
+    @property
+    def total_wall(self) -> float:
+        return (self.parse_wall or 0.0) + self.solve_wall
+
+    @property
+    def throughput(self) -> float | None:
+        """
+        Input megabytes per second of parse and solve.
+        """
+        if self.input_bytes is None or not self.total_wall:
+            return None
+        return self.input_bytes / self.total_wall / 1e6
+
+
+def measure(func: Callable, *args) -> tuple[Any, float, float]:
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    res = func(*args)
+    return res, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+def printed_answer(func: Callable, *args) -> str | None:
+    """
+    Call a print-only solver and return the last line it printed.
+    """
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        func(*args)
+    printed_lines = stdout.getvalue().split("\n")
+    return next((line for line in reversed(printed_lines) if line), None)
+
+
+def has_compute(module: ModuleType, part: int) -> bool:
+    return hasattr(module, "read_input") and hasattr(module, f"compute_{PARTS[part]}")
+
+
+def solve(module: ModuleType, part: int, path: str) -> Any:
+    if has_compute(module, part):
+        return getattr(module, f"compute_{PARTS[part]}")(module.read_input(path))
+    return printed_answer(getattr(module, PARTS[part]), path)
+
+
+def run_part(
+    day: int,
+    part: int,
+    path: str,
+    cache: Cache | None = None,
+    profile: bool = False,
+    engine: str = REFERENCE,
+) -> PartResult:
+    """
+    Run one part in the current process.
+    Days exposing ``read_input`` and ``compute_part_one``/``compute_part_two`` get
+    their parse and solve phases timed separately and their answer returned.
+    Other days are timed as a whole and their answer is the last printed line.
+    With a cache, the lookup and any parse or solve it falls back to are timed
+    as a whole. With ``profile``, the phases are profiled into ``res.profile``.
+    Days without the requested engine, or whose engine lacks the part, run their
+    reference functions, ``res.engine`` tells which.
+    """
+    res = PartResult(day=day, part=part, path=str(path))
+    if os.path.isfile(path):
+        res.input_bytes = os.path.getsize(path)
+    session = Session() if profile else contextlib.nullcontext()
+    try:
+        with session:
+            module, res.import_wall, _ = measure(load_day, day)
+            day_engines = engines(day) if has_compute(module, part) else {}
+            if engine not in day_engines or day_engines[engine].compute(part) is None:
+                engine = REFERENCE
+            res.engine = engine
+            if cache is not None and day_engines:
+                with phase("solve"):
+                    res.answer, res.solve_wall, res.solve_cpu = measure(
+                        cache.solve, day, part, path, engine
+                    )
+            elif day_engines:
+                implementation = day_engines[engine]
+                with phase("parse"):
+                    data, res.parse_wall, res.parse_cpu = measure(
+                        implementation.read_input, path
+                    )
+                with phase("solve"):
+                    res.answer, res.solve_wall, res.solve_cpu = measure(
+                        implementation.compute(part), data
+                    )
+            else:
+                with phase("solve"):
+                    res.answer, res.solve_wall, res.solve_cpu = measure(
+                        printed_answer, getattr(module, PARTS[part]), path
+                    )
+    except Exception as e:
+        res.error = repr(e)
+    if profile:
+        res.profile = session.report()
+    res.peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return res
+
+
+def run_part_isolated(
+    day: int,
+    part: int,
+    path: str,
+    cache: Cache | None = None,
+    profile: bool = False,
+    engine: str = REFERENCE,
+) -> PartResult:
+    """
+    Run one part in a fresh child process so that its peak RSS is its own.
+    """
+    method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context(method)
+    ) as executor:
+        return executor.submit(
+            run_part, day, part, path, cache, profile, engine
+        ).result()
+
+
+def run(
+    days: list[int],
+    parts: list[int],
+    input_template: str = DEFAULT_INPUT,
+    isolated: bool = True,
+    cache: Cache | None = None,
+    profile: bool = False,
+    engine: str = REFERENCE,
+) -> list[PartResult]:
+    runner = run_part_isolated if isolated else run_part
+    return [
+        runner(day, part, str(input_path(day, input_template)), cache, profile, engine)
+        for day in days
+        for part in parts
+    ]
+
+
+def _format_ms(seconds: float | None) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.1f}"
+
+
+def format_table(results: list[PartResult]) -> str:
+    header = (
+        "day",
+        "part",
+        "import ms",
+        "parse ms",
+        "solve ms",
+        "cpu ms",
+        "rss MB",
+        "MB/s",
+        "answer",
+    )
+    rows = [header]
+    for r in results:
+        cpu = (r.parse_cpu or 0.0) + r.solve_cpu
+        rows.append(
+            (
+                f"{r.day:02d}",
+                str(r.part),
+                _format_ms(r.import_wall),
+                _format_ms(r.parse_wall),
+                _format_ms(r.solve_wall),
+                _format_ms(cpu),
+                f"{r.peak_rss_kb / 1024:.1f}",
+                "-" if r.throughput is None else f"{r.throughput:.1f}",
+                f"ERROR {r.error}" if r.error else str(r.answer),
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header) - 1)]
+    lines = [
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths))
+        + "  "
+        + row[-1]
+        for row in rows
+    ]
+    successful = [r for r in results if not r.error]
+    if successful:
+        slowest = max(successful, key=lambda r: r.total_wall)
+        lines.append(
+            f"slowest: day {slowest.day:02d} part {slowest.part}"
+            f" ({_format_ms(slowest.total_wall)} ms)"
+        )
+    return "\n".join(lines)
+
+
+def main(args):
+    days = parse_days(args.days)
+    results = run(
+        days=days,
+        parts=args.part or list(PARTS),
+        input_template=args.input,
+        isolated=not args.in_process,
+        cache=Cache(directory=args.cache_dir) if args.cache else None,
+        profile=args.profile is not None,
+        engine=args.engine,
+    )
+    if args.profile is not None:
+        profiles = [
+            {"day": r.day, "part": r.part, "phases": r.profile} for r in results
+        ]
+        with open(args.profile, "w") as f:
+            json.dump(profiles, f, indent=2)
+    reports = [import_report(day) for day in days] if args.import_time else []
+    if args.json:
+        output: Any = [asdict(r) for r in results]
+        if args.import_time:
+            output = {"results": output, "imports": [asdict(r) for r in reports]}
+        print(json.dumps(output, indent=2, default=str))
+    else:
+        print(format_table(results))
+        if args.import_time:
+            print()
+            print(format_reports(reports))
+    return 1 if any(r.error for r in results) else 0
+
+
+def configure_parser(subparsers):
+    parser = subparsers.add_parser(
+        "run", help="run days and report timing, peak RSS and answers"
+    )
+    parser.add_argument(
+        "days", nargs="*", help="days to run, e.g. 3 5-7 (all by default)"
+    )
+    parser.add_argument("-p", "--part", type=int, choices=list(PARTS), action="append")
+    parser.add_argument(
+        "-i",
+        "--input",
+        default=DEFAULT_INPUT,
+        help="input path, '{day}' is replaced by the two-digit day (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-e",
+        "--engine",
+        default=REFERENCE,
+        help="engine of the days that offer it, see 'aoc diff' (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="run every part in this process (peak RSS becomes cumulative)",
+    )
+    parser.add_argument(
+        "--import-time",
+        action="store_true",
+        help="also report each day's import cost, measured with -X importtime",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="write per-phase timing, cProfile and tracemalloc statistics as JSON",
+    )
+    add_cache_arguments(parser)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.set_defaults(func=main)
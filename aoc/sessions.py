@@ -0,0 +1,153 @@
+"""
+Profiling sessions recording the phases marked with ``aoc.profiling.phase``.
+
+Within a session every phase gets its wall and CPU time, its tracemalloc peak
+and top allocations, and cProfile statistics of its own code. A phase entered
+inside another is recorded as "outer/inner": its time counts in the outer
+phase's wall and CPU time but not in the outer cProfile statistics.
+"""
+
+import cProfile
+import pstats
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from aoc import profiling
+
+
+@dataclass()
+class PhaseStats:
+    name: str
+    calls: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    # Highest traced memory above the phase's starting point
+    peak_bytes: int = 0
+    allocations: list[dict[str, Any]] = field(default_factory=list)
+    functions: list[dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass()
+class _Frame:
+    path: str
+    wall_start: float
+    cpu_start: float
+    profile: cProfile.Profile | None = None
+    snapshot: tracemalloc.Snapshot | None = None
+    memory_start: int = 0
+    peak: int = 0
+
+
+class Session:
+    """
+    Records the phases entered while it is active, one session at a time.
+    """
+
+    def __init__(self, cprofile: bool = True, memory: bool = True, top: int = 10):
+        self.cprofile = cprofile
+        self.memory = memory
+        self.top = top
+        self.phases: dict[str, PhaseStats] = {}
+        self._profiles: dict[str, cProfile.Profile] = {}
+        self._stack: list[_Frame] = []
+        self._started_tracing = False
+
+    def __enter__(self) -> "Session":
+        if profiling._session is not None:
+            raise RuntimeError("a profiling session is already active")
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        profiling._session = self
+        return self
+
+    def __exit__(self, *exc):
+        while self._stack:
+            self.exit(self._stack[-1].path.rpartition("/")[2])
+        profiling._session = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return False
+
+    def enter(self, name: str):
+        path = f"{self._stack[-1].path}/{name}" if self._stack else name
+        frame = _Frame(path, time.perf_counter(), time.process_time())
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1].peak = max(self._stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            frame.snapshot = tracemalloc.take_snapshot()
+            frame.memory_start = frame.peak = current
+        if self.cprofile:
+            if self._stack:
+                self._stack[-1].profile.disable()
+            frame.profile = self._profiles.setdefault(path, cProfile.Profile())
+        self._stack.append(frame)
+        if frame.profile is not None:
+            frame.profile.enable()
+
+    def exit(self, name: str):
+        if not self._stack or self._stack[-1].path.rpartition("/")[2] != name:
+            return
+        frame = self._stack.pop()
+        if frame.profile is not None:
+            frame.profile.disable()
+        stats = self.phases.setdefault(frame.path, PhaseStats(frame.path))
+        stats.calls += 1
+        stats.wall += time.perf_counter() - frame.wall_start
+        stats.cpu += time.process_time() - frame.cpu_start
+        if self.memory:
+            peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+            stats.peak_bytes = max(stats.peak_bytes, peak - frame.memory_start)
+            stats.allocations = self._allocations(frame.snapshot)
+            if self._stack:
+                self._stack[-1].peak = max(self._stack[-1].peak, peak)
+        if self.cprofile and self._stack:
+            self._stack[-1].profile.enable()
+
+    def _allocations(self, start: tracemalloc.Snapshot) -> list[dict[str, Any]]:
+        ignored = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, profiling.__file__),
+        )
+        end = tracemalloc.take_snapshot().filter_traces(ignored)
+        differences = end.compare_to(start.filter_traces(ignored), "lineno")
+        return [
+            {
+                "location": f"{diff.traceback[0].filename}:{diff.traceback[0].lineno}",
+                "size_diff": diff.size_diff,
+                "count_diff": diff.count_diff,
+            }
+            for diff in differences[: self.top]
+            if diff.size_diff > 0
+        ]
+
+    def _functions(self, path: str) -> list[dict[str, Any]]:
+        profile = self._profiles.get(path)
+        if profile is None:
+            return []
+        stats = pstats.Stats(profile).stats
+        slowest = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)
+        del slowest[self.top :]
+        return [
+            {
+                "function": pstats.func_std_string(function),
+                "calls": nb_calls,
+                "tottime": total_time,
+                "cumtime": cumulative_time,
+            }
+            for (function, (_, nb_calls, total_time, cumulative_time, _)) in slowest
+        ]
+
+    def report(self) -> list[dict[str, Any]]:
+        """
+        Phases in the order they were first left, as JSON-ready dicts.
+        """
+        for path, stats in self.phases.items():
+            stats.functions = self._functions(path)
+        return [asdict(stats) for stats in self.phases.values()]
@@ -0,0 +1,145 @@
+"""
+Incremental line input for the line-oriented days.
+
+``read_lines`` accepts a file path or ``-`` for standard input, and transparently
+decompresses gzip and zstd streams, recognised by their magic bytes. zstd needs
+the optional ``zstandard`` package. Nothing is read ahead beyond a buffer, so
+memory does not grow with the input.
+
+A pipe can only be read once, ``fan_out`` therefore feeds one pass over the
+lines to several consumers, such as both parts of a day. The days built on it
+keep ``read_input`` returning a list, so that the runner times and caches the
+parse phase, and give their scripts the lazy ``stream_input`` instead.
+"""
+
+import gzip
+import io
+import queue
+import sys
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Iterable, Iterator, TypeVar
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+STDIN = "-"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@contextmanager
+def open_binary(path) -> Iterator[BinaryIO]:
+    """
+    Binary stream of the decompressed content of ``path``, or of stdin for ``-``.
+    """
+    raw = sys.stdin.buffer if str(path) == STDIN else open(path, "rb")
+    try:
+        head = raw.peek(len(ZSTD_MAGIC))[: len(ZSTD_MAGIC)]
+        if head.startswith(GZIP_MAGIC):
+            with gzip.GzipFile(fileobj=raw) as stream:
+                yield stream
+        elif head.startswith(ZSTD_MAGIC):
+            import zstandard
+
+            with zstandard.ZstdDecompressor().stream_reader(raw) as stream:
+                yield io.BufferedReader(stream)
+        else:
+            yield raw
+    finally:
+        if raw is not sys.stdin.buffer:
+            raw.close()
+
+
+def read_lines(path) -> Iterator[str]:
+    """
+    Lines of the input, line endings normalized to ``\\n`` as in text mode.
+    """
+    with open_binary(path) as stream:
+        text = io.TextIOWrapper(stream, encoding="utf-8")
+        try:
+            yield from text
+        finally:
+            # Closing the wrapper would close stdin with it. When the generator is
+            # garbage collected the stream may already be closed
+            if not stream.closed:
+                text.detach()
+
+
+def read_byte_lines(path) -> Iterator[bytes]:
+    """
+    Lines of the input as bytes, with their line ending.
+    """
+    with open_binary(path) as stream:
+        yield from stream
+
+
+_END = object()
+
+
+def _consume(
+    consumer: Callable[[Iterator[T]], R], chunks: queue.Queue, results: list, index: int
+):
+    def items() -> Iterator[T]:
+        while (chunk := chunks.get()) is not _END:
+            yield from chunk
+
+    remaining = items()
+    try:
+        results[index] = consumer(remaining)
+    except BaseException as e:
+        results[index] = e
+    # Whatever the consumer left must still be taken off the queue, or the
+    # producer would block on it
+    for _ in remaining:
+        pass
+
+
+def fan_out(
+    items: Iterable[T],
+    *consumers: Callable[[Iterator[T]], R],
+    chunk_size: int = 1024,
+    max_chunks: int = 4,
+) -> list[R]:
+    """
+    Results of every consumer over a single pass of ``items``.
+    Each consumer runs in its own thread and reads from a queue of at most
+    ``max_chunks`` chunks, which bounds the memory whatever the input length.
+    """
+    results: list = [None] * len(consumers)
+    queues = [queue.Queue(maxsize=max_chunks) for _ in consumers]
+    threads = [
+        threading.Thread(target=_consume, args=(consumer, chunks, results, index))
+        for index, (consumer, chunks) in enumerate(zip(consumers, queues))
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        chunk: list[T] = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                for chunks in queues:
+                    chunks.put(chunk)
+                chunk = []
+        if chunk:
+            for chunks in queues:
+                chunks.put(chunk)
+    finally:
+        for chunks in queues:
+            chunks.put(_END)
+        for thread in threads:
+            thread.join()
+    for res in results:
+        if isinstance(res, BaseException):
+            raise res
+    return results
+
+
+def print_answers(items: Iterable[T], *consumers: Callable[[Iterator[T]], R], **kwargs):
+    """
+    Print the result of every consumer over one pass of ``items``, one per line.
+    """
+    for answer in fan_out(items, *consumers, **kwargs):
+        print(answer)
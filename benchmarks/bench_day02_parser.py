@@ -0,0 +1,66 @@
+"""
+Day 02 line parsers: the reference one, which builds a Cubes per draw and a list
+per game, and the folding one, which keeps three running maxima. Besides its
+time on a generated input, each records the mean tracemalloc peak of parsing a
+line in ``extra_info["peak_bytes_per_line"]``.
+"""
+
+import tracemalloc
+from typing import Callable
+
+import pytest
+
+from aoc.days import load_day
+
+SIZE = 10_000
+
+
+@pytest.fixture(scope="module")
+def day():
+    return load_day(2)
+
+
+@pytest.fixture(scope="module")
+def lines(generated_input) -> list[str]:
+    return generated_input(2, SIZE).read_text().splitlines()
+
+
+def parse_all(parse: Callable[[str], tuple], lines: list[str]) -> int:
+    return sum(parse(line)[0] for line in lines)
+
+
+def peak_bytes_per_line(parse: Callable[[str], tuple], lines: list[str]) -> float:
+    total = 0
+    tracemalloc.start()
+    try:
+        for line in lines:
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+            res = parse(line)
+            total += tracemalloc.get_traced_memory()[1] - start
+            del res
+    finally:
+        tracemalloc.stop()
+    return total / len(lines)
+
+
+def reference_parse(day) -> Callable[[str], tuple]:
+    def parse(line: str) -> tuple:
+        game_id, game = day.parse_game(line)
+        return game_id, day.smallest_including_bag(game)
+
+    return parse
+
+
+def bench_reference_parser(day, lines, benchmark, baseline):
+    parse = reference_parse(day)
+    res = baseline.check("02-parser-reference", benchmark, parse_all, parse, lines)
+    benchmark.extra_info["peak_bytes_per_line"] = peak_bytes_per_line(parse, lines)
+    assert res == parse_all(day.fold_game, lines)
+
+
+def bench_folding_parser(day, lines, benchmark, baseline):
+    baseline.check("02-parser-folding", benchmark, parse_all, day.fold_game, lines)
+    peak = peak_bytes_per_line(day.fold_game, lines)
+    benchmark.extra_info["peak_bytes_per_line"] = peak
+    assert peak < peak_bytes_per_line(reference_parse(day), lines)
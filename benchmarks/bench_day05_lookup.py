@@ -0,0 +1,46 @@
+"""
+Day 05 seed to location lookups, on a generated almanac and random seeds: the
+per-seed loop of part one against the NumPy batches of
+``PiecewiseTranslation.map_batches``.
+"""
+
+import pytest
+
+from aoc.days import load_day
+
+ALMANAC_SIZE = 100
+NB_SEEDS = 200_000
+
+
+@pytest.fixture(scope="module")
+def location(generated_input):
+    _, location = load_day(5).read_composed(generated_input(5, ALMANAC_SIZE))
+    return location
+
+
+@pytest.fixture(scope="module")
+def seeds():
+    np = pytest.importorskip("numpy")
+
+    return np.random.default_rng(0).integers(0, 2**32, NB_SEEDS)
+
+
+def loop_lookup(location, seeds: list[int]) -> list[int]:
+    return [location(seed) for seed in seeds]
+
+
+def numpy_lookup(location, seeds):
+    np = pytest.importorskip("numpy")
+
+    return np.concatenate(list(location.map_batches(seeds)))
+
+
+def bench_loop_lookup(location, seeds, benchmark, baseline):
+    seed_list = seeds.tolist()
+    res = baseline.check("05-lookup-loop", benchmark, loop_lookup, location, seed_list)
+    assert len(res) == NB_SEEDS
+
+
+def bench_numpy_lookup(location, seeds, benchmark, baseline):
+    res = baseline.check("05-lookup-numpy", benchmark, numpy_lookup, location, seeds)
+    assert res.tolist() == loop_lookup(location, seeds.tolist())
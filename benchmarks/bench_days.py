@@ -0,0 +1,44 @@
+import pytest
+
+from aoc.days import load_day
+from aoc.runner import solve
+
+# Generator sizes per day, see aoc.generators for what the size means
+SIZES = {
+    1: [1_000, 10_000, 100_000],
+    2: [1_000, 10_000, 100_000],
+    3: [50, 100, 200],
+    4: [1_000, 10_000],
+    5: [10, 100],
+    6: [4, 8, 16],
+    7: [1_000, 10_000],
+    8: [1_000, 10_000],
+    9: [1_000, 10_000],
+    10: [20, 40, 80],
+    11: [50, 100, 150],
+    12: [50, 200],
+    13: [50, 200, 1_000],
+    15: [1_000, 10_000, 100_000],
+    16: [20, 40, 60],
+    17: [10, 20, 30],
+    18: [100, 1_000, 10_000],
+    19: [50, 500],
+    20: [1, 2, 4],
+}
+
+CASES = [
+    pytest.param(day, size, part, id=f"{day:02d}-size{size}-part{part}")
+    for day, sizes in SIZES.items()
+    for size in sizes
+    for part in (1, 2)
+]
+
+
+@pytest.mark.parametrize("day, size, part", CASES)
+def bench_day(day, size, part, benchmark, baseline, generated_input):
+    module = load_day(day)
+    path = str(generated_input(day, size))
+    answer = baseline.check(
+        f"{day:02d}-size{size}-part{part}", benchmark, solve, module, part, path
+    )
+    assert answer is not None
@@ -0,0 +1,65 @@
+"""
+Interval-set engine of days 05 and 19 against the ``portion`` library it
+replaced, on the same random sets of closed integer intervals.
+"""
+
+import random
+
+import pytest
+
+from aoc.intervals import IntervalSet
+
+SIZES = [100, 1_000, 10_000]
+SHIFT = 7
+
+
+def random_pairs(rng: random.Random, nb_intervals: int) -> list[tuple[int, int]]:
+    lows = rng.sample(range(100 * nb_intervals), nb_intervals)
+    return [(low, low + rng.randrange(200)) for low in lows]
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"size{size}")
+def pairs(request):
+    rng = random.Random(request.param)
+    return (
+        request.param,
+        random_pairs(rng, request.param),
+        random_pairs(rng, request.param),
+    )
+
+
+def engine_workload(a_pairs, b_pairs) -> int:
+    a = IntervalSet.from_pairs(a_pairs)
+    b = IntervalSet.from_pairs(b_pairs)
+    return len(((a | b) - (a & b)).shifted(SHIFT))
+
+
+def portion_workload(a_pairs, b_pairs) -> int:
+    P = pytest.importorskip("portion")
+
+    a = P.Interval(*(P.closed(low, high) for low, high in a_pairs))
+    b = P.Interval(*(P.closed(low, high) for low, high in b_pairs))
+    shifted = ((a | b) - (a & b)).apply(
+        lambda x: x.replace(lower=lambda v: v + SHIFT, upper=lambda v: v + SHIFT)
+    )
+    return sum(
+        (i.upper - (i.right == P.OPEN)) - (i.lower + (i.left == P.OPEN)) + 1
+        for i in shifted
+        if not i.empty
+    )
+
+
+def bench_engine(pairs, benchmark, baseline):
+    size, a_pairs, b_pairs = pairs
+    res = baseline.check(
+        f"intervals-engine-size{size}", benchmark, engine_workload, a_pairs, b_pairs
+    )
+    assert res > 0
+
+
+def bench_portion(pairs, benchmark, baseline):
+    size, a_pairs, b_pairs = pairs
+    res = baseline.check(
+        f"intervals-portion-size{size}", benchmark, portion_workload, a_pairs, b_pairs
+    )
+    assert res == engine_workload(a_pairs, b_pairs)
@@ -0,0 +1,134 @@
+"""
+Baselines are stored per benchmark in ``baseline.json``: the best time over the
+rounds and the tracemalloc peak of one extra run. A benchmark fails when its peak
+exceeds the baseline by more than ``--baseline-threshold``, ignoring differences
+under 64 KB. Times depend on the machine that recorded them, so they are only
+compared with ``--baseline-timing``, ignoring differences under
+``--baseline-slack`` seconds that are only timer noise.
+
+    python -m pytest benchmarks                      # compare memory
+    python -m pytest benchmarks --baseline-update    # record on this machine
+    python -m pytest benchmarks --baseline-timing    # compare times too
+"""
+
+import json
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from aoc import generators
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("baseline")
+    group.addoption("--baseline-file", default=str(BASELINE_FILE))
+    group.addoption(
+        "--baseline-update",
+        action="store_true",
+        help="record the measured timings and memory as the new baselines",
+    )
+    group.addoption(
+        "--baseline-timing",
+        action="store_true",
+        help="also compare times, on the machine that recorded the baselines",
+    )
+    group.addoption(
+        "--baseline-threshold",
+        type=float,
+        default=0.5,
+        help="tolerated relative regression (default: %(default)s)",
+    )
+    group.addoption(
+        "--baseline-slack",
+        type=float,
+        default=0.005,
+        help="tolerated absolute regression in seconds (default: %(default)s)",
+    )
+    group.addoption("--baseline-rounds", type=int, default=5)
+
+
+class Baseline:
+    def __init__(
+        self,
+        path: Path,
+        threshold: float,
+        slack: float,
+        update: bool,
+        rounds: int,
+        timing: bool = False,
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.slacks = {"seconds": slack, "peak_kb": 64}
+        self.metrics = ["seconds", "peak_kb"] if timing else ["peak_kb"]
+        self.update = update
+        self.rounds = rounds
+        self.entries: dict[str, dict[str, float]] = (
+            json.loads(path.read_text()) if path.exists() else {}
+        )
+
+    def check(self, key: str, benchmark, func: Callable, *args) -> Any:
+        res = benchmark.pedantic(func, args=args, rounds=self.rounds, iterations=1)
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        measured = {"seconds": benchmark.stats.stats.min, "peak_kb": peak / 1024}
+        if self.update:
+            self.entries[key] = measured
+            return res
+        expected = self.entries.get(key)
+        if expected is None:
+            return res
+        regressions = [
+            f"{metric} {measured[metric]:.4g} > {expected[metric]:.4g}"
+            for metric in self.metrics
+            if measured[metric] > expected[metric] * (1 + self.threshold)
+            and measured[metric] > expected[metric] + self.slacks[metric]
+        ]
+        if regressions:
+            pytest.fail(f"{key} regressed: " + ", ".join(regressions))
+        return res
+
+    def save(self):
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture(scope="session")
+def baseline(pytestconfig):
+    res = Baseline(
+        path=Path(pytestconfig.getoption("baseline_file")),
+        threshold=pytestconfig.getoption("baseline_threshold"),
+        slack=pytestconfig.getoption("baseline_slack"),
+        update=pytestconfig.getoption("baseline_update"),
+        rounds=pytestconfig.getoption("baseline_rounds"),
+        timing=pytestconfig.getoption("baseline_timing"),
+    )
+    yield res
+    if res.update:
+        res.save()
+
+
+@pytest.fixture(scope="session")
+def generated_input(tmp_path_factory):
+    """
+    Path of the generated input for (day, size), written once per session.
+    """
+    directory = tmp_path_factory.mktemp("inputs")
+    paths: dict[tuple[int, int], Path] = {}
+
+    def get(day: int, size: int) -> Path:
+        if (day, size) not in paths:
+            path = directory / f"{day:02d}-{size}.txt"
+            with open(path, "w") as f:
+                generators.write_input(day, size, f)
+            paths[(day, size)] = path
+        return paths[(day, size)]
+
+    return get
@@ -0,0 +1,68 @@
+"""
+``chunk_bounds`` cuts, and ``map_chunks`` against a single pass over the lines.
+"""
+
+import pytest
+
+from aoc.chunks import MappedInput, chunk_bounds, map_chunks
+
+BUFFER = b"first line\nsecond\n\nfourth line, longer\nfifth\n"
+
+
+def test_chunk_bounds_cover_whole_lines():
+    for nb_chunks in range(1, 12):
+        bounds = chunk_bounds(BUFFER, nb_chunks)
+        assert 1 <= len(bounds) <= nb_chunks
+        assert bounds[0][0] == 0
+        assert bounds[-1][1] == len(BUFFER)
+        assert all(end == start for ((_, end), (start, _)) in zip(bounds, bounds[1:]))
+        # Every chunk but the last ends just after a newline
+        assert all(BUFFER[end - 1] == ord("\n") for (_, end) in bounds)
+
+
+def test_chunk_bounds_cut_inside_a_line():
+    # The middle of the buffer falls inside the fourth line, the first chunk
+    # takes it whole
+    fourth = BUFFER.index(b"fourth")
+    fifth = BUFFER.index(b"fifth")
+    assert fourth < len(BUFFER) // 2 < fifth
+    assert chunk_bounds(BUFFER, 2) == [(0, fifth), (fifth, len(BUFFER))]
+
+
+def test_chunk_bounds_more_chunks_than_lines():
+    bounds = chunk_bounds(BUFFER, 100)
+    assert len(bounds) <= BUFFER.count(b"\n")
+    assert [BUFFER[start:end] for (start, end) in bounds] == BUFFER.splitlines(
+        keepends=True
+    )
+
+
+def test_chunk_bounds_without_final_newline():
+    buffer = b"a\nbb\nccc"
+    bounds = chunk_bounds(buffer, 3)
+    assert b"".join(buffer[start:end] for (start, end) in bounds) == buffer
+    assert bounds[-1][1] == len(buffer)
+
+
+def test_chunk_bounds_empty():
+    assert chunk_bounds(b"", 4) == []
+
+
+def count_lines(chunk: bytes) -> int:
+    return chunk.count(b"\n")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_map_chunks(tmp_path, workers):
+    path = tmp_path / "input.txt"
+    path.write_bytes(BUFFER * 100)
+    counts = map_chunks(count_lines, str(path), workers=workers, chunk_bytes=64)
+    assert len(counts) > 1
+    assert sum(counts) == 500
+
+
+def test_mapped_input_is_not_cached():
+    import pickle
+
+    with pytest.raises(TypeError):
+        pickle.dumps(MappedInput("input.txt"))
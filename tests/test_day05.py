@@ -0,0 +1,93 @@
+"""
+Day 05 ``PiecewiseTranslation`` against the maps applied line by line, layer
+after layer, on random small almanacs.
+"""
+
+import random
+
+import pytest
+
+from aoc.days import load_day
+from aoc.intervals import IntervalSet
+
+NB_CASES = 300
+DOMAIN = range(-5, 60)
+
+day = load_day(5)
+
+
+def random_map(rng: random.Random) -> list[tuple[int, int, int]]:
+    """
+    (destination start, source start, range length) lines with disjoint sources.
+    """
+    bounds = sorted(rng.sample(range(0, 50), 2 * rng.randint(0, 4)))
+    return [
+        (rng.randint(0, 50), low, high - low)
+        for (low, high) in zip(bounds[::2], bounds[1::2])
+    ]
+
+
+def apply_map(current_map: list[tuple[int, int, int]], x: int) -> int:
+    for dest_low, orig_low, rng in current_map:
+        if orig_low <= x < orig_low + rng:
+            return dest_low + x - orig_low
+    return x
+
+
+def apply_maps(maps: list[list[tuple[int, int, int]]], x: int) -> int:
+    for current_map in maps:
+        x = apply_map(current_map, x)
+    return x
+
+
+def compose(maps: list[list[tuple[int, int, int]]]):
+    functions = map(day.PiecewiseTranslation.from_map, maps)
+    composition = next(functions)
+    for function in functions:
+        composition = composition.then(function)
+    return composition
+
+
+@pytest.fixture
+def rng(request) -> random.Random:
+    return random.Random(request.node.name)
+
+
+def test_from_map(rng):
+    for _ in range(NB_CASES):
+        current_map = random_map(rng)
+        function = day.PiecewiseTranslation.from_map(current_map)
+        assert all(function(x) == apply_map(current_map, x) for x in DOMAIN)
+
+
+def test_then(rng):
+    for _ in range(NB_CASES):
+        maps = [random_map(rng) for _ in range(rng.randint(1, 4))]
+        composition = compose(maps)
+        assert all(composition(x) == apply_maps(maps, x) for x in DOMAIN)
+        # A single table per function: consecutive pieces translate differently
+        translations = [0, *composition.translations]
+        assert all(a != b for (a, b) in zip(translations, translations[1:]))
+
+
+def test_minimum(rng):
+    for _ in range(NB_CASES):
+        maps = [random_map(rng) for _ in range(rng.randint(1, 4))]
+        composition = compose(maps)
+        seeds = IntervalSet.from_pairs(
+            (low, low + rng.randint(0, 10))
+            for low in rng.sample(range(0, 50), rng.randint(1, 3))
+        )
+        assert composition.minimum(seeds) == min(
+            apply_maps(maps, x) for (low, high) in seeds for x in range(low, high + 1)
+        )
+
+
+def test_map_batches(rng):
+    np = pytest.importorskip("numpy")
+
+    maps = [random_map(rng) for _ in range(4)]
+    composition = compose(maps)
+    xs = np.arange(DOMAIN.start, DOMAIN.stop, dtype=np.int64)
+    res = np.concatenate(list(composition.map_batches(xs, batch_size=16)))
+    assert res.tolist() == [apply_maps(maps, x) for x in DOMAIN]
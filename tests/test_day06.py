@@ -0,0 +1,85 @@
+"""
+Day 06 race counts against every hold time on small races, and the batch
+against the exact count on races of any size.
+"""
+
+import random
+
+import pytest
+
+from aoc.days import load_day
+
+day = load_day(6)
+
+
+def brute_force(duration: int, record: int) -> int:
+    return sum(hold * (duration - hold) > record for hold in range(duration + 1))
+
+
+@pytest.fixture
+def rng(request) -> random.Random:
+    return random.Random(request.node.name)
+
+
+def test_small_races():
+    for duration in range(60):
+        for record in range(-2, duration * duration // 4 + 2):
+            assert day.compute_nb_solutions_exact(duration, record) == brute_force(
+                duration, record
+            )
+
+
+def test_batch_small_races():
+    pytest.importorskip("numpy")
+
+    races = [
+        (duration, record)
+        for duration in range(60)
+        for record in range(-2, duration * duration // 4 + 2)
+    ]
+    durations, records = zip(*races)
+    assert day.compute_nb_solutions_batch(durations, records) == [
+        brute_force(duration, record) for (duration, record) in races
+    ]
+
+
+def tied_races(rng: random.Random, max_duration: int) -> list[tuple[int, int]]:
+    """
+    Races whose record equals a hold time's distance, give or take one: the
+    square roots are then exact or just off, where rounding errors would show.
+    """
+    races = []
+    for _ in range(200):
+        duration = rng.randint(0, max_duration)
+        hold = rng.randint(0, duration // 2)
+        for offset in (-1, 0, 1):
+            races.append((duration, hold * (duration - hold) + offset))
+    return races
+
+
+@pytest.mark.parametrize(
+    "max_duration",
+    [
+        pytest.param(day.FLOAT_MAX_DURATION, id="float"),
+        pytest.param(2**31, id="int64"),
+        pytest.param(2**80, id="huge"),
+    ],
+)
+def test_batch_matches_exact(rng, max_duration):
+    pytest.importorskip("numpy")
+
+    races = tied_races(rng, max_duration)
+    durations, records = zip(*races)
+    assert day.compute_nb_solutions_batch(durations, records) == [
+        day.compute_nb_solutions_exact(duration, record) for (duration, record) in races
+    ]
+
+
+def test_exact_on_huge_races(rng):
+    for duration, record in tied_races(rng, 2**200):
+        nb_solutions = day.compute_nb_solutions_exact(duration, record)
+        hold_min = (duration - nb_solutions + 1) // 2
+        # hold_min is the shortest winning hold: it wins and the one before loses
+        if nb_solutions:
+            assert hold_min * (duration - hold_min) > record
+        assert (hold_min - 1) * (duration - hold_min + 1) <= record
@@ -0,0 +1,78 @@
+"""
+``Grid`` over the raw bytes of inputs, ``\n`` and ``\r\n`` terminated.
+"""
+
+import pytest
+
+from aoc.grid import Grid
+
+ROWS = [b"#..", b".#.", b"..#", b"##."]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(b"\n".join(ROWS), id="lf-no-final"),
+        pytest.param(b"\n".join(ROWS) + b"\n", id="lf"),
+        pytest.param(b"\r\n".join(ROWS), id="crlf-no-final"),
+        pytest.param(b"\r\n".join(ROWS) + b"\r\n", id="crlf"),
+        pytest.param(b"\r\n".join(ROWS) + b"\r\n\r\n", id="crlf-blank-lines"),
+    ],
+)
+def test_from_buffer(data):
+    grid = Grid.from_buffer(bytearray(data))
+    assert grid.shape == (len(ROWS), len(ROWS[0]))
+    assert [bytes(row) for row in grid.rows()] == ROWS
+
+
+def test_from_buffer_single_row():
+    assert Grid.from_buffer(bytearray(b"#.#\r\n")).shape == (1, 3)
+    assert Grid.from_buffer(bytearray(b"#.#")).shape == (1, 3)
+    assert Grid.from_buffer(bytearray()).shape == (0, 0)
+
+
+def test_ragged_rows():
+    with pytest.raises(ValueError, match="unequal length"):
+        Grid.from_buffer(bytearray(b"#..\n.#\n..#\n"))
+    with pytest.raises(ValueError, match="unequal length"):
+        Grid.from_buffer(bytearray(b"#..\r\n.#.\n..#\r\n"))
+
+
+@pytest.fixture(params=[b"\n", b"\r\n"], ids=["lf", "crlf"])
+def grid(request) -> Grid:
+    return Grid.from_buffer(bytearray(request.param.join(ROWS) + request.param))
+
+
+def test_indexing(grid):
+    for i, row in enumerate(ROWS):
+        for j, cell in enumerate(row):
+            assert grid[i, j] == cell
+    assert str(grid) == b"\n".join(ROWS).decode()
+
+
+def test_contains(grid):
+    inside = {(i, j) for i in range(len(ROWS)) for j in range(len(ROWS[0]))}
+    for i in range(-1, len(ROWS) + 1):
+        for j in range(-1, len(ROWS[0]) + 2):
+            assert ((i, j) in grid) == ((i, j) in inside)
+
+
+def test_columns(grid):
+    assert [bytes(column) for column in grid.columns()] == [
+        bytes(row[j] for row in ROWS) for j in range(len(ROWS[0]))
+    ]
+
+
+def test_find_all(grid):
+    # The row terminators are never reported, even when searched for
+    assert list(grid.find_all(ord("#"))) == [(0, 0), (1, 1), (2, 2), (3, 0), (3, 1)]
+    assert list(grid.find_all(ord("\n"))) == []
+    assert list(grid.find_all(ord("\r"))) == []
+
+
+def test_translated(grid):
+    translated = grid.translated(bytes.maketrans(b"#.", b"10"))
+    assert [bytes(row) for row in translated.rows()] == [
+        row.translate(bytes.maketrans(b"#.", b"10")) for row in ROWS
+    ]
+    assert bytes(grid.row(0)) == ROWS[0]
@@ -0,0 +1,102 @@
+"""
+``IntervalSet`` against Python sets of the same integers, on random small sets.
+"""
+
+import random
+
+import pytest
+
+from aoc.intervals import IntervalSet
+
+NB_CASES = 500
+
+
+def random_pairs(rng: random.Random) -> list[tuple[int, int]]:
+    # Reversed pairs are empty intervals, which from_pairs must skip
+    return [
+        (rng.randint(-20, 20), rng.randint(-20, 20)) for _ in range(rng.randint(0, 6))
+    ]
+
+
+def integers(pairs: list[tuple[int, int]]) -> set[int]:
+    return {x for (low, high) in pairs for x in range(low, high + 1)}
+
+
+def as_set(intervals: IntervalSet) -> set[int]:
+    return integers(list(intervals))
+
+
+def is_normalized(intervals: IntervalSet) -> bool:
+    pairs = list(intervals)
+    return all(low <= high for (low, high) in pairs) and all(
+        high + 1 < next_low for ((_, high), (next_low, _)) in zip(pairs, pairs[1:])
+    )
+
+
+@pytest.fixture
+def rng(request) -> random.Random:
+    return random.Random(request.node.name)
+
+
+def cases(rng: random.Random):
+    for _ in range(NB_CASES):
+        a, b = random_pairs(rng), random_pairs(rng)
+        yield (a, IntervalSet.from_pairs(a)), (b, IntervalSet.from_pairs(b))
+
+
+def test_from_pairs(rng):
+    for (pairs, intervals), _ in cases(rng):
+        assert is_normalized(intervals)
+        assert as_set(intervals) == integers(pairs)
+        assert len(intervals) == len(integers(pairs))
+        assert bool(intervals) == bool(integers(pairs))
+
+
+def test_contains(rng):
+    for (pairs, intervals), _ in cases(rng):
+        expected = integers(pairs)
+        for x in range(-22, 23):
+            assert (x in intervals) == (x in expected)
+
+
+@pytest.mark.parametrize(
+    "operator",
+    [
+        pytest.param(lambda a, b: a | b, id="or"),
+        pytest.param(lambda a, b: a & b, id="and"),
+        pytest.param(lambda a, b: a - b, id="sub"),
+    ],
+)
+def test_operators(rng, operator):
+    for (a, a_intervals), (b, b_intervals) in cases(rng):
+        res = operator(a_intervals, b_intervals)
+        assert is_normalized(res)
+        assert as_set(res) == operator(integers(a), integers(b))
+
+
+def test_equality_is_set_equality(rng):
+    for (a, a_intervals), (b, b_intervals) in cases(rng):
+        assert (a_intervals == b_intervals) == (integers(a) == integers(b))
+
+
+def test_union_all(rng):
+    for _ in range(NB_CASES):
+        sets = [random_pairs(rng) for _ in range(rng.randint(0, 4))]
+        res = IntervalSet.union_all(IntervalSet.from_pairs(pairs) for pairs in sets)
+        assert is_normalized(res)
+        assert as_set(res) == set().union(*map(integers, sets))
+
+
+def test_shifted(rng):
+    for (pairs, intervals), _ in cases(rng):
+        offset = rng.randint(-30, 30)
+        res = intervals.shifted(offset)
+        assert is_normalized(res)
+        assert as_set(res) == {x + offset for x in integers(pairs)}
+
+
+def test_closed():
+    assert as_set(IntervalSet.closed(3, 5)) == {3, 4, 5}
+    assert IntervalSet.closed(5, 3) == IntervalSet()
+    assert IntervalSet.closed(2, 4).lower == 2
+    assert IntervalSet.closed(2, 4).upper == 4
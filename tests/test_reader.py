@@ -0,0 +1,62 @@
+"""
+``blocks`` and ``tokens`` on small files, ``\n`` and ``\r\n`` terminated.
+"""
+
+import pytest
+
+from aoc.reader import blocks, spans, tokens
+
+
+@pytest.fixture(params=["\n", "\r\n"], ids=["lf", "crlf"])
+def write(request, tmp_path):
+    """
+    Path of a file holding the given lines, joined with the line ending.
+    """
+
+    def write(*lines: str, final_newline: bool = True):
+        path = tmp_path / "input.txt"
+        newline = request.param
+        path.write_bytes(
+            (newline.join(lines) + (newline if final_newline else "")).encode()
+        )
+        return path
+
+    return write
+
+
+def test_blocks(write):
+    path = write("seeds: 1 2", "", "a:", "3 4", "5 6", "", "b:", "7 8")
+    assert [block.replace(b"\r", b"") for block in blocks(path)] == [
+        b"seeds: 1 2",
+        b"a:\n3 4\n5 6",
+        b"b:\n7 8",
+    ]
+
+
+@pytest.mark.parametrize("final_newline", [True, False])
+def test_blocks_ends(write, final_newline):
+    path = write("", "#.", ".#", "", "", "", "..", "", final_newline=final_newline)
+    assert [block.replace(b"\r", b"") for block in blocks(path)] == [
+        b"#.\n.#",
+        b"..",
+    ]
+
+
+def test_blocks_empty(write):
+    assert list(blocks(write(final_newline=False))) == []
+    assert list(blocks(write(""))) == []
+
+
+@pytest.mark.parametrize("final_newline", [True, False])
+def test_tokens(write, final_newline):
+    path = write("rn=1,cm-, qp=3,,", final_newline=final_newline)
+    assert list(tokens(path)) == [b"rn=1", b"cm-", b"qp=3"]
+
+
+def test_spans():
+    buffer = b"  a ;b;; ;c  "
+    assert [buffer[span] for span in spans(buffer, b";", strip=b" ")] == [
+        b"a",
+        b"b",
+        b"c",
+    ]
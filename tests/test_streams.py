@@ -0,0 +1,67 @@
+"""
+``fan_out`` consumers over one pass of the items, and ``read_lines`` decoding.
+"""
+
+import gzip
+import threading
+
+import pytest
+
+from aoc.streams import fan_out, read_lines
+
+
+def run_with_timeout(func, *args, **kwargs):
+    """
+    ``func(*args, **kwargs)``, failing instead of hanging when it deadlocks.
+    """
+    outcome: dict = {}
+
+    def target():
+        try:
+            outcome["result"] = func(*args, **kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive(), "fan_out deadlocked"
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def test_order():
+    items = range(10_000)
+    res = run_with_timeout(
+        fan_out, iter(items), list, sum, max, chunk_size=7, max_chunks=2
+    )
+    assert res == [list(items), sum(items), max(items)]
+
+
+def test_consumer_stopping_early():
+    res = run_with_timeout(fan_out, iter(range(10_000)), next, sum, chunk_size=3)
+    assert res == [0, sum(range(10_000))]
+
+
+def test_consumer_error():
+    def failing(items):
+        next(items)
+        raise ValueError("bad line")
+
+    with pytest.raises(ValueError, match="bad line"):
+        run_with_timeout(
+            fan_out, iter(range(10_000)), sum, failing, chunk_size=5, max_chunks=1
+        )
+
+
+def test_empty():
+    assert run_with_timeout(fan_out, iter([]), list, sum) == [[], 0]
+
+
+@pytest.mark.parametrize("compress", [False, True], ids=["plain", "gzip"])
+def test_read_lines(tmp_path, compress):
+    data = b"one\r\ntwo\nthree"
+    path = tmp_path / "input.txt"
+    path.write_bytes(gzip.compress(data) if compress else data)
+    assert list(read_lines(path)) == ["one\n", "two\n", "three"]